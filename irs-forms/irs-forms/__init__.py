@@ -10,54 +10,28 @@ This library provides:
 """
 
 import os
+import sys
 import json
+import logging
+import importlib
+import functools
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, TYPE_CHECKING
 from decimal import Decimal
 
-from .forms import (
-    BaseForm,
-    Form1040,
-    Form1040Schedule1,
-    Form1040Schedule2, 
-    Form1040Schedule3,
-    Form1040ScheduleA,
-    Form1040ScheduleB,
-    Form1040ScheduleC,
-    Form1040ScheduleD,
-    Form1040ScheduleE,
-    Form1040ScheduleF,
-    Form8812,
-    Form8889,
-    Form8959,
-    Form8995,
-    FormW2,
-    Form1099INT,
-    Form1099DIV,
-    Form1099MISC,
-    Form1099NEC,
-    Form1099G,
-    Form1099R,
-    Form1098
-)
+# orjson parses the definitions files several times faster; it is optional
+# (pip install irs-forms[orjson]) and stdlib json is used when it's absent
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-from .generators import (
-    PDFFormGenerator,
-    XMLGenerator,
-    EFileGenerator
-)
-
-from .validators import (
-    FormValidator,
-    IRSValidator,
-    ComplianceChecker
-)
-
-from .downloaders import (
-    IRSFormDownloader,
-    FormUpdater,
-    SchemaDownloader
-)
+if TYPE_CHECKING:
+    from .forms import BaseForm
+    from .generators import PDFFormGenerator, XMLGenerator, EFileGenerator
+    from .downloaders import IRSFormDownloader, FormUpdater
+    from .validators import IRSValidator
 
 from .constants import (
     CURRENT_TAX_YEAR,
@@ -67,10 +41,139 @@ from .constants import (
     VALIDATION_RULES
 )
 
+# Public names resolved on first attribute access (PEP 562), mapped to the
+# submodule defining them, so ``import irs_forms`` does not pull in the
+# form, validator or PDF/XML/download modules up front
+_LAZY_EXPORTS = {
+    **dict.fromkeys((
+        'BaseForm',
+        'Form1040',
+        'Form1040Schedule1',
+        'Form1040Schedule2',
+        'Form1040Schedule3',
+        'Form1040ScheduleA',
+        'Form1040ScheduleB',
+        'Form1040ScheduleC',
+        'Form1040ScheduleD',
+        'Form1040ScheduleE',
+        'Form1040ScheduleF',
+        'Form8812',
+        'Form8889',
+        'Form8959',
+        'Form8995',
+        'FormW2',
+        'Form1099INT',
+        'Form1099DIV',
+        'Form1099MISC',
+        'Form1099NEC',
+        'Form1099G',
+        'Form1099R',
+        'Form1098'
+    ), '.forms'),
+    **dict.fromkeys((
+        'PDFFormGenerator',
+        'XMLGenerator',
+        'EFileGenerator'
+    ), '.generators'),
+    **dict.fromkeys((
+        'FormValidator',
+        'IRSValidator',
+        'ComplianceChecker'
+    ), '.validators'),
+    **dict.fromkeys((
+        'IRSFormDownloader',
+        'FormUpdater',
+        'SchemaDownloader'
+    ), '.downloaders')
+}
+
+def __getattr__(name: str) -> Any:
+    """Lazily import submodule exports and the default manager"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    if name == 'default_forms_manager':
+        return _default_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+logger = logging.getLogger(__name__)
+
 __version__ = "1.0.0"
 __author__ = "E-File Backend Team"
 __description__ = "Official IRS Forms Processing Library"
 
+# Form names accepted by get_form, mapped to their class names in .forms
+_FORM_CLASS_NAMES = {
+    '1040': 'Form1040',
+    '1040Schedule1': 'Form1040Schedule1',
+    '1040Schedule2': 'Form1040Schedule2',
+    '1040Schedule3': 'Form1040Schedule3',
+    '1040ScheduleA': 'Form1040ScheduleA',
+    '1040ScheduleB': 'Form1040ScheduleB',
+    '1040ScheduleC': 'Form1040ScheduleC',
+    '1040ScheduleD': 'Form1040ScheduleD',
+    '1040ScheduleE': 'Form1040ScheduleE',
+    '1040ScheduleF': 'Form1040ScheduleF',
+    '8812': 'Form8812',
+    '8889': 'Form8889',
+    '8959': 'Form8959',
+    '8995': 'Form8995',
+    'W2': 'FormW2',
+    '1099-INT': 'Form1099INT',
+    '1099-DIV': 'Form1099DIV',
+    '1099-MISC': 'Form1099MISC',
+    '1099-NEC': 'Form1099NEC',
+    '1099-G': 'Form1099G',
+    '1099-R': 'Form1099R',
+    '1098': 'Form1098'
+}
+
+# Read-only view of the form classes; filled on the first get_form call so
+# the forms module is only imported once a form is actually requested
+_FORM_CLASS_CACHE: Dict[str, type] = {}
+_FORM_CLASSES: Mapping[str, type] = MappingProxyType(_FORM_CLASS_CACHE)
+
+def _resolve_form_class(form_name: str) -> type:
+    """Slow path for get_form: validate the name and populate _FORM_CLASSES"""
+    if form_name not in _FORM_CLASS_NAMES:
+        raise ValueError(f"Unsupported form: {form_name}")
+    
+    if not _FORM_CLASS_CACHE:
+        forms = importlib.import_module('.forms', __name__)
+        # Interned keys let lookups with interned names (literals, or names
+        # from other interned tables) match on identity after the hash
+        _FORM_CLASS_CACHE.update({
+            sys.intern(name): getattr(forms, class_name)
+            for name, class_name in _FORM_CLASS_NAMES.items()
+        })
+    
+    return _FORM_CLASS_CACHE[form_name]
+
+# (cache_dir, tax_year) pairs this process has already tried to download
+# definitions for, so a failed update isn't retried by every new manager
+_update_attempted = set()
+
+@functools.lru_cache(maxsize=8)
+def _compiled_definitions(tax_year: int) -> Optional[Tuple[Mapping[str, Any], float]]:
+    """
+    Form definitions pre-compiled to data/form_definitions_<year>.py, if
+    shipped, with the compiled module's modification time
+    """
+    try:
+        module = importlib.import_module(f'.data.form_definitions_{tax_year}', __name__)
+    except ImportError:
+        return None
+    return MappingProxyType(module.DEFINITIONS), os.path.getmtime(module.__file__)
+
+@functools.lru_cache(maxsize=8)
+def _load_definitions(cache_dir: Path, tax_year: int) -> Mapping[str, Any]:
+    """Parse a year's form definitions once and share a read-only view"""
+    definitions_file = cache_dir / f'form_definitions_{tax_year}.json'
+    with open(definitions_file, 'rb') as f:
+        return MappingProxyType(_json_loads(f.read()))
+
 class IRSFormsManager:
     """
     Main interface for IRS forms management
@@ -83,63 +186,131 @@ class IRSFormsManager:
     - Download latest forms from IRS
     """
     
+    __slots__ = (
+        'tax_year',
+        'cache_dir',
+        'form_definitions',
+        '_pdf_generator',
+        '_xml_generator',
+        '_efile_generator',
+        '_validator',
+        '_downloader',
+        '_form_updater'
+    )
+    
+    # Cache directories already created and definitions files already loaded
+    # by this process, so repeat constructions skip the mkdir/stat syscalls
+    _ensured_dirs = set()
+    _found_definitions = set()
+    
     def __init__(self, tax_year: int = CURRENT_TAX_YEAR, cache_dir: str = None):
         self.tax_year = tax_year
         self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.irs_forms_cache'
-        self.cache_dir.mkdir(exist_ok=True)
         
-        # Initialize components
-        self.pdf_generator = PDFFormGenerator(self.cache_dir)
-        self.xml_generator = XMLGenerator(tax_year)
-        self.efile_generator = EFileGenerator(tax_year)
-        self.validator = IRSValidator(tax_year)
-        self.downloader = IRSFormDownloader(self.cache_dir)
-        self.form_updater = FormUpdater(self.cache_dir)
-        
-        # Load form definitions
+        # Components are created on first use by the properties below;
+        # only the form definitions are loaded up front
+        self._pdf_generator = None
+        self._xml_generator = None
+        self._efile_generator = None
+        self._validator = None
+        self._downloader = None
+        self._form_updater = None
         self._load_form_definitions()
     
+    @property
+    def pdf_generator(self) -> 'PDFFormGenerator':
+        """Fills PDF forms; imports the PDF stack on first access"""
+        if self._pdf_generator is None:
+            from .generators import PDFFormGenerator
+            self._ensure_cache()
+            self._pdf_generator = PDFFormGenerator(self.cache_dir)
+        return self._pdf_generator
+    
+    @property
+    def xml_generator(self) -> 'XMLGenerator':
+        """Builds form XML documents"""
+        if self._xml_generator is None:
+            from .generators import XMLGenerator
+            self._xml_generator = XMLGenerator(self.tax_year)
+        return self._xml_generator
+    
+    @property
+    def efile_generator(self) -> 'EFileGenerator':
+        """Builds e-file return XML for submission"""
+        if self._efile_generator is None:
+            from .generators import EFileGenerator
+            self._efile_generator = EFileGenerator(self.tax_year)
+        return self._efile_generator
+    
+    @property
+    def validator(self) -> 'IRSValidator':
+        """Validates form data against IRS rules"""
+        if self._validator is None:
+            from .validators import IRSValidator
+            self._validator = IRSValidator(self.tax_year)
+        return self._validator
+    
+    @property
+    def downloader(self) -> 'IRSFormDownloader':
+        """Downloads form files from the IRS"""
+        if self._downloader is None:
+            from .downloaders import IRSFormDownloader
+            self._ensure_cache()
+            self._downloader = IRSFormDownloader(self.cache_dir)
+        return self._downloader
+    
+    @property
+    def form_updater(self) -> 'FormUpdater':
+        """Refreshes cached form definitions"""
+        if self._form_updater is None:
+            from .downloaders import FormUpdater
+            self._ensure_cache()
+            self._form_updater = FormUpdater(self.cache_dir)
+        return self._form_updater
+    
+    def _ensure_cache(self):
+        """Create the cache directory, once per directory per process"""
+        if self.cache_dir in self._ensured_dirs:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(self.cache_dir)
+    
     def _load_form_definitions(self):
         """Load IRS form definitions from cache or download if needed"""
         definitions_file = self.cache_dir / f'form_definitions_{self.tax_year}.json'
         
-        if not definitions_file.exists():
-            self.update_forms()
+        # Once a cache file has been loaded it stays the source, so later
+        # managers skip the stat as well as the parse
+        if definitions_file not in self._found_definitions:
+            # Definitions compiled at build time (tools/compile_definitions.py)
+            # load from bytecode and skip the JSON parse entirely, unless the
+            # cache holds a newer (downloaded) definitions file
+            compiled = _compiled_definitions(self.tax_year)
+            if compiled is not None:
+                compiled_definitions, compiled_mtime = compiled
+                try:
+                    use_compiled = definitions_file.stat().st_mtime <= compiled_mtime
+                except OSError:
+                    use_compiled = True
+                if use_compiled:
+                    self.form_definitions = compiled_definitions
+                    return
+            elif not definitions_file.is_file():
+                self._ensure_cache()
+                update_key = (self.cache_dir, self.tax_year)
+                if update_key not in _update_attempted:
+                    _update_attempted.add(update_key)
+                    # Reloads self.form_definitions itself on success
+                    if self.update_forms():
+                        return
         
-        with open(definitions_file, 'r') as f:
-            self.form_definitions = json.load(f)
+        self.form_definitions = _load_definitions(self.cache_dir, self.tax_year)
+        self._found_definitions.add(definitions_file)
     
-    def get_form(self, form_name: str) -> BaseForm:
+    def get_form(self, form_name: str) -> 'BaseForm':
         """Get a specific IRS form class"""
-        form_classes = {
-            '1040': Form1040,
-            '1040Schedule1': Form1040Schedule1,
-            '1040Schedule2': Form1040Schedule2,
-            '1040Schedule3': Form1040Schedule3,
-            '1040ScheduleA': Form1040ScheduleA,
-            '1040ScheduleB': Form1040ScheduleB,
-            '1040ScheduleC': Form1040ScheduleC,
-            '1040ScheduleD': Form1040ScheduleD,
-            '1040ScheduleE': Form1040ScheduleE,
-            '1040ScheduleF': Form1040ScheduleF,
-            '8812': Form8812,
-            '8889': Form8889,
-            '8959': Form8959,
-            '8995': Form8995,
-            'W2': FormW2,
-            '1099-INT': Form1099INT,
-            '1099-DIV': Form1099DIV,
-            '1099-MISC': Form1099MISC,
-            '1099-NEC': Form1099NEC,
-            '1099-G': Form1099G,
-            '1099-R': Form1099R,
-            '1098': Form1098
-        }
-        
-        if form_name not in form_classes:
-            raise ValueError(f"Unsupported form: {form_name}")
-        
-        return form_classes[form_name](self.tax_year)
+        form_class = _FORM_CLASSES.get(form_name) or _resolve_form_class(form_name)
+        return form_class(self.tax_year)
     
     def validate_form_data(self, form_name: str, form_data: dict) -> dict:
         """Validate form data against IRS requirements"""
@@ -158,10 +329,16 @@ class IRSFormsManager:
     def update_forms(self) -> bool:
         """Download and update IRS forms from official sources"""
         try:
-            return self.form_updater.update_all_forms(self.tax_year)
-        except Exception as e:
-            print(f"Error updating forms: {e}")
+            updated = self.form_updater.update_all_forms(self.tax_year)
+        except Exception:
+            logger.exception("Error updating forms for tax year %s", self.tax_year)
             return False
+        
+        if updated:
+            _load_definitions.cache_clear()
+            _compiled_definitions.cache_clear()
+            self._load_form_definitions()
+        return updated
     
     def list_supported_forms(self) -> List[str]:
         """Get list of supported form names"""
@@ -181,6 +358,8 @@ class IRSFormsManager:
 class FormDataManager:
     """Helper class for managing form data"""
     
+    __slots__ = ('forms_manager',)
+    
     def __init__(self, forms_manager: IRSFormsManager):
         self.forms_manager = forms_manager
     
@@ -242,17 +421,19 @@ __all__ = [
     'VALIDATION_RULES'
 ]
 
-# Default instance for easy access
-default_forms_manager = IRSFormsManager()
+@functools.lru_cache(maxsize=1)
+def _default_manager() -> IRSFormsManager:
+    """Default manager for the convenience functions, created on first use"""
+    return IRSFormsManager()
 
-def get_form(form_name: str) -> BaseForm:
+def get_form(form_name: str) -> 'BaseForm':
     """Convenience function to get a form using default manager"""
-    return default_forms_manager.get_form(form_name)
+    return _default_manager().get_form(form_name)
 
 def validate_form(form_name: str, form_data: dict) -> dict:
     """Convenience function to validate form data"""
-    return default_forms_manager.validate_form_data(form_name, form_data)
+    return _default_manager().validate_form_data(form_name, form_data)
 
 def generate_pdf(form_name: str, form_data: dict, output_path: str) -> str:
     """Convenience function to generate PDF"""
-    return default_forms_manager.generate_pdf(form_name, form_data, output_path)
+    return _default_manager().generate_pdf(form_name, form_data, output_path)
@@ -1,17 +1,12 @@
 # irs-forms/setup.py
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
 setup(
     name="irs-forms",
     version="1.0.0",
     author="Ope Olatunji",
     author_email="ope.olatunji@taxmeai.com",
     description="Official IRS Forms Processing and E-Filing Library",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
     url="https://github.com/taxmeai/e-file-tax-libraries/irs-forms",
     packages=find_packages(),
     classifiers=[
@@ -48,10 +43,14 @@ setup(
         "pdf": [
             "pdftk-java>=3.0.0",
         ],
+        "orjson": [
+            "orjson>=3.8",
+        ],
     },
     package_data={
         "irs_forms": [
             "data/*.json",
+            "data/*.py",
             "data/forms/*.json",
             "data/schemas/*.xsd",
             "templates/*.xml",
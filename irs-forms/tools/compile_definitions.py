@@ -0,0 +1,69 @@
+"""
+Pre-compile IRS form definitions into Python modules
+
+Reads each form_definitions_<year>.json file and writes a sibling
+form_definitions_<year>.py containing DEFINITIONS = {...} as Python
+literals. IRSFormsManager imports these modules (loaded from bytecode)
+in preference to parsing the JSON at runtime.
+
+Usage:
+    python tools/compile_definitions.py irs_forms/data
+    python tools/compile_definitions.py ~/.irs_forms_cache --output irs_forms/data
+"""
+
+import argparse
+import json
+import pprint
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+HEADER = (
+    '"""\n'
+    'IRS form definitions for tax year {year}\n'
+    '\n'
+    'Generated by tools/compile_definitions.py from {source} - do not edit\n'
+    '"""\n'
+    '\n'
+)
+
+def compile_definitions(source_dir: Path, output_dir: Path) -> List[Path]:
+    """Compile every form_definitions_<year>.json in source_dir"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    
+    for json_file in sorted(source_dir.glob('form_definitions_*.json')):
+        year = json_file.stem.rsplit('_', 1)[-1]
+        if not year.isdigit():
+            continue
+        
+        with open(json_file, 'r') as f:
+            definitions = json.load(f)
+        
+        output_file = output_dir / f'{json_file.stem}.py'
+        with open(output_file, 'w') as f:
+            f.write(HEADER.format(year=year, source=json_file.name))
+            f.write('DEFINITIONS = ')
+            f.write(pprint.pformat(definitions, width=120, sort_dicts=False))
+            f.write('\n')
+        written.append(output_file)
+    
+    return written
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('source_dir', type=Path, help='directory containing form_definitions_<year>.json')
+    parser.add_argument('--output', type=Path, help='directory for the generated modules (default: source_dir)')
+    args = parser.parse_args(argv)
+    
+    written = compile_definitions(args.source_dir, args.output or args.source_dir)
+    for path in written:
+        print(f"Wrote {path}")
+    
+    if not written:
+        print(f"No form definitions found in {args.source_dir}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,6 +28,7 @@ from .constants import (
     TAX_BRACKETS,
     STANDARD_DEDUCTIONS,
     FILING_STATUSES,
+    FilingStatus,
     STATE_TAX_RATES
 )
 
@@ -39,9 +40,15 @@ from .validators import (
 
 from .utils import (
     format_currency,
+    format_cents,
+    to_cents,
+    from_cents,
     calculate_agi,
     calculate_taxable_income,
     apply_tax_brackets,
+    apply_tax_brackets_batch,
+    apply_tax_brackets_batch_cents,
+    compute_eic_batch,
     calculate_credits
 )
 
@@ -58,9 +65,11 @@ class TaxCalculator:
         result = calculator.calculate_taxes(taxpayer_data)
     """
     
+    __slots__ = ('tax_year', 'federal_calc', 'state_calc', 'payroll_calc', 'summary_calc')
+    
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
-        self.federal_calc = FederalTaxCalculator(tax_year)
+        self.federal_calc = FederalTaxCalculator.get(tax_year)
         self.state_calc = StateTaxCalculator(tax_year)
         self.payroll_calc = PayrollTaxCalculator(tax_year)
         self.summary_calc = TaxSummaryCalculator(tax_year)
@@ -69,6 +78,10 @@ class TaxCalculator:
         """Calculate complete tax return"""
         return self.summary_calc.calculate_complete_return(taxpayer_data)
     
+    def calculate_batch(self, scenarios: list) -> list:
+        """Calculate complete tax returns for many scenarios, in input order"""
+        return self.summary_calc.calculate_complete_return_batch(scenarios)
+    
     def calculate_federal_only(self, taxpayer_data: dict) -> dict:
         """Calculate federal taxes only"""
         return self.federal_calc.calculate(taxpayer_data)
@@ -100,13 +113,20 @@ __all__ = [
     'TAX_BRACKETS',
     'STANDARD_DEDUCTIONS',
     'FILING_STATUSES',
+    'FilingStatus',
     'STATE_TAX_RATES',
     'TaxDataValidator',
     'FormValidator',
     'CalculationValidator',
     'format_currency',
+    'format_cents',
+    'to_cents',
+    'from_cents',
     'calculate_agi',
     'calculate_taxable_income',
     'apply_tax_brackets',
+    'apply_tax_brackets_batch',
+    'apply_tax_brackets_batch_cents',
+    'compute_eic_batch',
     'calculate_credits'
 ]
@@ -2,34 +2,160 @@
 Tax calculation engines for federal and state taxes
 """
 
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Any, Optional, Tuple
+from bisect import bisect_left
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import logging
 
 from .constants import (
+    FILING_STATUSES,
+    FilingStatus,
     TAX_BRACKETS, 
+    TAX_BRACKET_ARRAYS,
+    get_bracket_arrays,
     STANDARD_DEDUCTIONS, 
     PAYROLL_TAX_RATES,
     CHILD_TAX_CREDIT_AMOUNTS,
-    EARNED_INCOME_CREDIT_TABLE
+    SE_TAX_FACTORS,
+    TAX_BRACKETS_2024,
+    STD_DED_2024,
+    PAYROLL_2024,
+    CTC_2024,
+    SE_FACTORS_2024,
+    NO_INCOME_TAX_STATES,
+    state_rate_units,
+    to_units,
+    RATE_SCALE,
+    BracketArrays
 )
 from .utils import (
-    calculate_agi,
     calculate_taxable_income,
-    apply_tax_brackets,
-    round_to_cents
+    round_to_cents,
+    to_cents,
+    from_cents,
+    round_div,
+    apply_tax_brackets_scaled
 )
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal('0')
+
+# Estimated-tax safe harbor multipliers, below and above the AGI threshold
+_SAFE_HARBOR_AGI_THRESHOLD = Decimal('150000')
+_SAFE_HARBOR_LOW = Decimal('1.0')
+_SAFE_HARBOR_HIGH = Decimal('1.1')
+
+# W-2 and 1099 boxes each calculation totals, in _form_totals order
+_FEDERAL_W2_FIELDS = ('wages_tips_compensation', 'federal_income_tax_withheld', 'medicare_wages')
+_FEDERAL_1099_FIELDS = ('amount_1', 'federal_income_tax_withheld')
+_PAYROLL_W2_FIELDS = (
+    'social_security_wages',
+    'medicare_wages',
+    'social_security_tax_withheld',
+    'medicare_tax_withheld'
+)
+
+def _percent(part: int, whole: int) -> Decimal:
+    """part / whole as a percent rounded half up to 2 places; 0 if whole <= 0"""
+    if whole <= 0:
+        return from_cents(0)
+    return from_cents(round_div(part * 10000, whole))
+
+def _form_totals(forms: List[dict], fields: Tuple[str, ...]) -> List[int]:
+    """Totals of the given form fields, in cents, in a single pass over the forms"""
+    totals = [0] * len(fields)
+    for form in forms:
+        for i, field in enumerate(fields):
+            totals[i] += to_cents(form.get(field, 0))
+    return totals
+
+class _StatusProfile(NamedTuple):
+    """Parameters for one filing status in one tax year, amounts in cents"""
+    standard_deduction: Decimal
+    standard_deduction_cents: int
+    bracket_arrays: BracketArrays
+    marginal_percents: Tuple[Decimal, ...]
+    ctc_phase_out: int
+    additional_medicare_threshold: int
+    eic_income_limit: int
+
+class _IncomeSteps(NamedTuple):
+    """One return's AGI and taxable income plus the form totals later steps use, in cents"""
+    agi: int
+    taxable_income: int
+    w2_withholding: int
+    w2_medicare_wages: int
+    withholding_1099: int
+
 class FederalTaxCalculator:
-    """Federal income tax calculator following IRS rules"""
+    """
+    Federal income tax calculator following IRS rules
+    
+    Amounts are carried as integer cents through the calculation; each
+    computed line item is rounded half up to the cent, and Decimal values
+    are only built for the returned result.
+    """
+    
+    # Shared instances by (class, tax_year), see get()
+    _instances: Dict[tuple, 'FederalTaxCalculator'] = {}
     
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
-        self.tax_brackets = TAX_BRACKETS.get(tax_year, TAX_BRACKETS[2024])
-        self.standard_deductions = STANDARD_DEDUCTIONS.get(tax_year, STANDARD_DEDUCTIONS[2024])
+        self.tax_brackets = TAX_BRACKETS.get(tax_year, TAX_BRACKETS_2024)
+        self.standard_deductions = STANDARD_DEDUCTIONS.get(tax_year, STD_DED_2024)
+        
+        # Per-year credit and payroll parameters, in cents and RATE_SCALE units
+        ctc = CHILD_TAX_CREDIT_AMOUNTS.get(tax_year, CTC_2024)
+        self._ctc_per_child = to_cents(ctc['per_child'])
+        self._ctc_refundable_per_child = to_cents(ctc['refundable_portion'])
+        
+        payroll = PAYROLL_TAX_RATES.get(tax_year, PAYROLL_2024)
+        se_factors = SE_TAX_FACTORS.get(tax_year, SE_FACTORS_2024)
+        self._se_income_factor = to_units(se_factors['deduction_factor'], RATE_SCALE)
+        self._se_ss_wage_base = to_cents(payroll['social_security_wage_base']) * RATE_SCALE
+        self._se_ss_rate = to_units(payroll['self_employment_ss_rate'], RATE_SCALE)
+        self._se_medicare_rate = to_units(payroll['self_employment_medicare_rate'], RATE_SCALE)
+        self._additional_medicare_rate = to_units(payroll['additional_medicare_rate'], RATE_SCALE)
+        
+        # Everything that depends on filing status, resolved once and indexed
+        # by FilingStatus, so a calculation makes a single per-status lookup.
+        # Bracket arrays are compiled at import (constants.TAX_BRACKET_ARRAYS)
+        bracket_year = tax_year if tax_year in TAX_BRACKET_ARRAYS else 2024
+        profiles = []
+        for status, name in zip(FilingStatus, FILING_STATUSES):
+            joint = status == FilingStatus.MARRIED_FILING_JOINTLY
+            arrays = get_bracket_arrays(bracket_year, status)
+            profiles.append(_StatusProfile(
+                standard_deduction=self.standard_deductions[name],
+                standard_deduction_cents=to_cents(self.standard_deductions[name]),
+                bracket_arrays=arrays,
+                # RATE_SCALE units are hundredths of a percent
+                marginal_percents=tuple(from_cents(rate) for rate in arrays[2]),
+                ctc_phase_out=to_cents(ctc[f'phase_out_{name}']),
+                additional_medicare_threshold=to_cents(
+                    payroll['additional_medicare_threshold_married'] if joint
+                    else payroll['additional_medicare_threshold_single']
+                ),
+                # Simplified EIC limit - in practice this would use IRS tables
+                eic_income_limit=6000000 if joint else 5000000
+            ))
+        self._profiles = tuple(profiles)
+        
+    @classmethod
+    def get(cls, tax_year: int = 2024) -> 'FederalTaxCalculator':
+        """
+        Shared calculator for tax_year
         
+        Calculators hold only per-year tables, never per-return state, so one
+        instance per year can serve every caller
+        """
+        key = (cls, tax_year)
+        calculator = cls._instances.get(key)
+        if calculator is None:
+            calculator = cls._instances[key] = cls(tax_year)
+        return calculator
+    
     def calculate(self, taxpayer_data: dict) -> dict:
         """
         Calculate complete federal tax liability
@@ -46,202 +172,254 @@ class FederalTaxCalculator:
             dict: Complete federal tax calculation
         """
         try:
-            # Step 1: Calculate Adjusted Gross Income (AGI)
-            agi = self._calculate_agi(taxpayer_data)
-            
-            # Step 2: Calculate taxable income
-            taxable_income = self._calculate_taxable_income(taxpayer_data, agi)
+            profile = self._profiles[FilingStatus.parse(taxpayer_data['filing_status'])]
+            steps = self._calculate_income_steps(taxpayer_data, profile)
             
             # Step 3: Calculate income tax using tax brackets
-            income_tax = self._calculate_income_tax(
-                taxable_income, 
-                taxpayer_data['filing_status']
-            )
-            
-            # Step 4: Calculate and apply credits
-            credits = self._calculate_credits(taxpayer_data, agi)
-            tax_after_credits = max(Decimal('0'), income_tax - credits['total_nonrefundable'])
-            
-            # Step 5: Calculate other taxes (self-employment, etc.)
-            other_taxes = self._calculate_other_taxes(taxpayer_data)
-            
-            # Step 6: Total tax liability
-            total_tax = tax_after_credits + other_taxes
+            income_tax = self._calculate_income_tax(steps.taxable_income, profile)
             
-            # Step 7: Calculate refund/owe amount
-            total_payments = self._calculate_total_payments(taxpayer_data)
-            refund_amount = max(Decimal('0'), total_payments - total_tax + credits['total_refundable'])
-            owe_amount = max(Decimal('0'), total_tax - total_payments - credits['total_refundable'])
+            return self._complete_calculation(taxpayer_data, profile, steps, income_tax)
             
-            # Step 8: Calculate effective and marginal tax rates
-            effective_rate = (total_tax / agi * 100) if agi > 0 else Decimal('0')
-            marginal_rate = self._get_marginal_tax_rate(taxable_income, taxpayer_data['filing_status'])
+        except Exception as e:
+            logger.error(f"Federal tax calculation error: {str(e)}")
+            raise
+    
+    def calculate_batch(self, records: List[dict]) -> List[dict]:
+        """
+        Calculate federal tax for many taxpayer records, in input order
+        
+        Records are grouped by filing status, so each status is parsed and
+        resolved to its profile once per batch and its bracket arrays are
+        applied across the whole group
+        """
+        try:
+            by_status: Dict[object, List[int]] = {}
+            for index, taxpayer_data in enumerate(records):
+                by_status.setdefault(taxpayer_data['filing_status'], []).append(index)
             
-            return {
-                'agi': round_to_cents(agi),
-                'taxable_income': round_to_cents(taxable_income),
-                'income_tax_before_credits': round_to_cents(income_tax),
-                'total_credits': round_to_cents(credits['total_nonrefundable'] + credits['total_refundable']),
-                'tax_after_credits': round_to_cents(tax_after_credits),
-                'other_taxes': round_to_cents(other_taxes),
-                'total_tax_liability': round_to_cents(total_tax),
-                'total_payments': round_to_cents(total_payments),
-                'refund_amount': round_to_cents(refund_amount),
-                'owe_amount': round_to_cents(owe_amount),
-                'effective_tax_rate': round_to_cents(effective_rate),
-                'marginal_tax_rate': round_to_cents(marginal_rate),
-                'credits_breakdown': credits,
-                'calculation_details': {
-                    'standard_deduction_used': taxpayer_data.get('deduction_type') == 'standard',
-                    'standard_deduction_amount': self.standard_deductions[taxpayer_data['filing_status']],
-                    'tax_year': self.tax_year
-                }
-            }
+            results: List[Optional[dict]] = [None] * len(records)
+            for status, indices in by_status.items():
+                profile = self._profiles[FilingStatus.parse(status)]
+                group = [records[i] for i in indices]
+                steps = [self._calculate_income_steps(data, profile) for data in group]
+                income_taxes = self._calculate_income_tax_batch(
+                    [step.taxable_income for step in steps], profile
+                )
+                for i, data, step, income_tax in zip(indices, group, steps, income_taxes):
+                    results[i] = self._complete_calculation(data, profile, step, income_tax)
+            return results
             
         except Exception as e:
-            logger.error(f"Federal tax calculation error: {str(e)}")
+            logger.error(f"Federal batch tax calculation error: {str(e)}")
             raise
     
-    def _calculate_agi(self, taxpayer_data: dict) -> Decimal:
-        """Calculate Adjusted Gross Income"""
+    def _calculate_income_steps(self, taxpayer_data: dict,
+                                profile: _StatusProfile) -> _IncomeSteps:
+        """Form totals, AGI and taxable income (steps 1-2), in cents"""
+        # W-2 and 1099 totals used across the steps, summed once
         income_sources = taxpayer_data.get('income_sources', {})
-        
-        # W-2 wages
-        w2_wages = sum(
-            Decimal(str(w2.get('wages_tips_compensation', 0)))
-            for w2 in income_sources.get('w2_forms', [])
+        w2_wages, w2_withholding, w2_medicare_wages = _form_totals(
+            income_sources.get('w2_forms', []),
+            _FEDERAL_W2_FIELDS
+        )
+        income_1099, withholding_1099 = _form_totals(
+            income_sources.get('1099_forms', []),
+            _FEDERAL_1099_FIELDS
         )
         
-        # 1099 income
-        income_1099_total = sum(
-            Decimal(str(form_1099.get('amount_1', 0)))
-            for form_1099 in income_sources.get('1099_forms', [])
+        # Step 1: Calculate Adjusted Gross Income (AGI)
+        agi = self._calculate_agi(taxpayer_data, income_sources, w2_wages, income_1099)
+        
+        # Step 2: Calculate taxable income
+        taxable_income = self._calculate_taxable_income(taxpayer_data, agi, profile)
+        
+        return _IncomeSteps(agi, taxable_income, w2_withholding, w2_medicare_wages, withholding_1099)
+    
+    def _complete_calculation(self, taxpayer_data: dict, profile: _StatusProfile,
+                              steps: _IncomeSteps, income_tax: int) -> dict:
+        """Credits, other taxes, payments and rates (steps 4-8) and the result dict"""
+        agi, taxable_income = steps.agi, steps.taxable_income
+        
+        # Step 4: Calculate and apply credits
+        credits = self._calculate_credits(taxpayer_data, agi, profile)
+        tax_after_credits = max(0, income_tax - credits['total_nonrefundable'])
+        
+        # Step 5: Calculate other taxes (self-employment, etc.)
+        other_taxes = self._calculate_other_taxes(taxpayer_data, profile, steps.w2_medicare_wages)
+        
+        # Step 6: Total tax liability
+        total_tax = tax_after_credits + other_taxes
+        
+        # Step 7: Calculate refund/owe amount
+        total_payments = self._calculate_total_payments(
+            taxpayer_data, steps.w2_withholding, steps.withholding_1099
         )
+        balance = total_payments + credits['total_refundable'] - total_tax
+        refund_amount, owe_amount = (balance, 0) if balance >= 0 else (0, -balance)
+        
+        # Step 8: Calculate effective and marginal tax rates
+        effective_rate = _percent(total_tax, agi)
+        marginal_rate = self._get_marginal_tax_rate(taxable_income, profile)
         
+        return {
+            'agi': from_cents(agi),
+            'taxable_income': from_cents(taxable_income),
+            'income_tax_before_credits': from_cents(income_tax),
+            'total_credits': from_cents(credits['total_nonrefundable'] + credits['total_refundable']),
+            'tax_after_credits': from_cents(tax_after_credits),
+            'other_taxes': from_cents(other_taxes),
+            'total_tax_liability': from_cents(total_tax),
+            'total_payments': from_cents(total_payments),
+            'refund_amount': from_cents(refund_amount),
+            'owe_amount': from_cents(owe_amount),
+            'effective_tax_rate': effective_rate,
+            'marginal_tax_rate': marginal_rate,
+            'credits_breakdown': {name: from_cents(amount) for name, amount in credits.items()},
+            'calculation_details': {
+                'standard_deduction_used': taxpayer_data.get('deduction_type') == 'standard',
+                'standard_deduction_amount': profile.standard_deduction,
+                'tax_year': self.tax_year
+            }
+        }
+    
+    def _calculate_agi(self, taxpayer_data: dict, income_sources: dict,
+                       w2_wages: int, income_1099_total: int) -> int:
+        """Calculate Adjusted Gross Income, in cents"""
         # Other income
-        other_income = Decimal(str(income_sources.get('other_income', 0)))
+        other_income = to_cents(income_sources.get('other_income', 0))
         
         # Total income
         total_income = w2_wages + income_1099_total + other_income
         
         # Above-the-line deductions
         adjustments = taxpayer_data.get('adjustments', {})
-        student_loan_interest = Decimal(str(adjustments.get('student_loan_interest', 0)))
-        educator_expenses = Decimal(str(adjustments.get('educator_expenses', 0)))
-        hsa_deduction = Decimal(str(adjustments.get('hsa_deduction', 0)))
+        student_loan_interest = to_cents(adjustments.get('student_loan_interest', 0))
+        educator_expenses = to_cents(adjustments.get('educator_expenses', 0))
+        hsa_deduction = to_cents(adjustments.get('hsa_deduction', 0))
         
         total_adjustments = student_loan_interest + educator_expenses + hsa_deduction
         
         agi = total_income - total_adjustments
         
-        return max(Decimal('0'), agi)
+        return max(0, agi)
     
-    def _calculate_taxable_income(self, taxpayer_data: dict, agi: Decimal) -> Decimal:
-        """Calculate taxable income after deductions"""
-        filing_status = taxpayer_data['filing_status']
-        
+    def _calculate_taxable_income(self, taxpayer_data: dict, agi: int,
+                                  profile: _StatusProfile) -> int:
+        """Calculate taxable income after deductions, in cents"""
         # Determine deduction amount
         if taxpayer_data.get('deduction_type') == 'itemized':
-            deductions = taxpayer_data.get('itemized_deductions', {})
-            total_itemized = sum(
-                Decimal(str(amount)) 
-                for amount in deductions.values() 
-                if isinstance(amount, (int, float, str))
+            deductions = taxpayer_data.get('itemized_deductions', {}).values()
+            
+            # Whole-dollar ints sum natively; only floats and strings need
+            # per-value conversion
+            whole_dollars = sum(amount for amount in deductions if type(amount) is int)
+            total_itemized = whole_dollars * 100 + sum(
+                to_cents(amount) 
+                for amount in deductions 
+                if type(amount) is not int and isinstance(amount, (int, float, str))
             )
             deduction_amount = total_itemized
         else:
             # Use standard deduction
-            deduction_amount = self.standard_deductions[filing_status]
+            deduction_amount = profile.standard_deduction_cents
         
         # Calculate taxable income
-        taxable_income = agi - deduction_amount
-        
-        return max(Decimal('0'), taxable_income)
+        return calculate_taxable_income(agi, deduction_amount)
     
-    def _calculate_income_tax(self, taxable_income: Decimal, filing_status: str) -> Decimal:
-        """Apply tax brackets to calculate income tax"""
-        brackets = self.tax_brackets[filing_status]
-        tax = Decimal('0')
-        
-        for min_income, max_income, rate in brackets:
-            if taxable_income > min_income:
-                bracket_income = min(taxable_income, max_income) - min_income
-                if bracket_income > 0:
-                    tax += bracket_income * Decimal(str(rate))
-                
-                if taxable_income <= max_income:
-                    break
-        
-        return tax
+    def _calculate_income_tax(self, taxable_income: int, profile: _StatusProfile) -> int:
+        """Apply tax brackets to calculate income tax, in cents"""
+        # No taxable income (common after deductions) needs no bracket lookup
+        if taxable_income <= 0:
+            return 0
+        
+        tax = apply_tax_brackets_scaled(taxable_income, profile.bracket_arrays)
+        return round_div(tax, RATE_SCALE)
     
-    def _get_marginal_tax_rate(self, taxable_income: Decimal, filing_status: str) -> Decimal:
-        """Get marginal tax rate for given income level"""
-        brackets = self.tax_brackets[filing_status]
-        
-        for min_income, max_income, rate in brackets:
-            if min_income <= taxable_income <= max_income:
-                return Decimal(str(rate)) * 100
-        
-        # If above all brackets, return highest rate
-        return Decimal(str(brackets[-1][2])) * 100
+    def _calculate_income_tax_batch(self, taxable_incomes: List[int],
+                                    profile: _StatusProfile) -> List[int]:
+        """Income tax for many taxable incomes under one status's brackets, in cents"""
+        arrays = profile.bracket_arrays
+        return [
+            round_div(apply_tax_brackets_scaled(taxable_income, arrays), RATE_SCALE)
+            if taxable_income > 0 else 0
+            for taxable_income in taxable_incomes
+        ]
+    
+    def _get_marginal_tax_rate(self, taxable_income: int, profile: _StatusProfile) -> Decimal:
+        """Get marginal tax rate (percent) for given income level, in cents"""
+        # Brackets include their upper bound, so income exactly on a threshold
+        # keeps the lower rate; income above all brackets gets the highest rate
+        i = max(0, bisect_left(profile.bracket_arrays[0], taxable_income) - 1)
+        return profile.marginal_percents[i]
     
-    def _calculate_credits(self, taxpayer_data: dict, agi: Decimal) -> dict:
-        """Calculate tax credits"""
+    def _calculate_credits(self, taxpayer_data: dict, agi: int,
+                           profile: _StatusProfile) -> dict:
+        """Calculate tax credits, in cents"""
         credits = {
-            'child_tax_credit': Decimal('0'),
-            'earned_income_credit': Decimal('0'),
-            'education_credits': Decimal('0'),
-            'total_nonrefundable': Decimal('0'),
-            'total_refundable': Decimal('0')
+            'child_tax_credit': 0,
+            'earned_income_credit': 0,
+            'education_credits': 0,
+            'total_nonrefundable': 0,
+            'total_refundable': 0
         }
         
-        # Child Tax Credit
-        dependents = taxpayer_data.get('dependents', [])
-        qualifying_children = [
-            dep for dep in dependents 
-            if dep.get('relationship') == 'child' and dep.get('age', 0) < 17
-        ]
+        # Count children for both credits in one pass: any age for the EIC,
+        # under 17 for the Child Tax Credit
+        eic_children = 0
+        ctc_children = 0
+        for dep in taxpayer_data.get('dependents', []):
+            if dep.get('relationship') == 'child':
+                eic_children += 1
+                if dep.get('age', 0) < 17:
+                    ctc_children += 1
         
-        if qualifying_children:
+        # Child Tax Credit
+        if ctc_children:
             child_credit = self._calculate_child_tax_credit(
-                len(qualifying_children), 
+                ctc_children, 
                 agi, 
-                taxpayer_data['filing_status']
+                profile
             )
             credits['child_tax_credit'] = child_credit['total_credit']
             credits['total_refundable'] += child_credit['refundable_portion']
             credits['total_nonrefundable'] += child_credit['nonrefundable_portion']
         
         # Earned Income Credit
-        if taxpayer_data.get('earned_income', 0) > 0:
-            eic = self._calculate_earned_income_credit(taxpayer_data, agi)
+        earned_income = taxpayer_data.get('earned_income', 0)
+        if earned_income > 0:
+            eic = self._calculate_earned_income_credit(
+                to_cents(earned_income), 
+                agi, 
+                profile, 
+                eic_children
+            )
             credits['earned_income_credit'] = eic
             credits['total_refundable'] += eic
         
         # Education Credits
         education_expenses = taxpayer_data.get('education_expenses', 0)
         if education_expenses > 0:
-            education_credit = self._calculate_education_credits(education_expenses, agi)
+            education_credit = self._calculate_education_credits(to_cents(education_expenses), agi)
             credits['education_credits'] = education_credit
             credits['total_nonrefundable'] += education_credit
         
         return credits
     
-    def _calculate_child_tax_credit(self, num_children: int, agi: Decimal, filing_status: str) -> dict:
-        """Calculate Child Tax Credit"""
-        credit_amounts = CHILD_TAX_CREDIT_AMOUNTS[self.tax_year]
-        
+    def _calculate_child_tax_credit(self, num_children: int, agi: int,
+                                    profile: _StatusProfile) -> dict:
+        """Calculate Child Tax Credit, in cents"""
         # Base credit amount
-        base_credit = num_children * credit_amounts['per_child']
+        base_credit = num_children * self._ctc_per_child
         
-        # Phase-out calculation
-        phase_out_threshold = credit_amounts[f'phase_out_{filing_status}']
+        # Phase-out calculation: $50 for each $1,000, or fraction thereof, of
+        # AGI over the threshold (ceiling division on cents)
+        phase_out_threshold = profile.ctc_phase_out
         if agi > phase_out_threshold:
-            phase_out_amount = ((agi - phase_out_threshold) / 1000).to_integral_value(ROUND_HALF_UP) * 50
-            base_credit = max(Decimal('0'), base_credit - phase_out_amount)
+            phase_out_amount = -(-(agi - phase_out_threshold) // 100000) * 5000
+            base_credit = max(0, base_credit - phase_out_amount)
         
         # Refundable portion
-        refundable_portion = min(base_credit, credit_amounts['refundable_portion'] * num_children)
+        refundable_portion = min(base_credit, self._ctc_refundable_per_child * num_children)
         nonrefundable_portion = base_credit - refundable_portion
         
         return {
@@ -250,118 +428,92 @@ class FederalTaxCalculator:
             'nonrefundable_portion': nonrefundable_portion
         }
     
-    def _calculate_earned_income_credit(self, taxpayer_data: dict, agi: Decimal) -> Decimal:
-        """Calculate Earned Income Credit (simplified)"""
-        earned_income = Decimal(str(taxpayer_data.get('earned_income', 0)))
-        filing_status = taxpayer_data['filing_status']
-        num_children = len([
-            dep for dep in taxpayer_data.get('dependents', [])
-            if dep.get('relationship') == 'child'
-        ])
-        
-        # Simplified EIC calculation - in practice this would use IRS tables
-        if filing_status == 'married_filing_jointly':
-            income_limit = 60000
-        else:
-            income_limit = 50000
-        
-        if agi > income_limit:
-            return Decimal('0')
+    def _calculate_earned_income_credit(self, earned_income: int, agi: int,
+                                        profile: _StatusProfile, num_children: int) -> int:
+        """Calculate Earned Income Credit (simplified), in cents"""
+        if agi > profile.eic_income_limit:
+            return 0
         
         # Basic EIC calculation (simplified)
         if num_children == 0:
-            max_credit = 600
+            max_credit = 60000
         elif num_children == 1:
-            max_credit = 3800
+            max_credit = 380000
         elif num_children == 2:
-            max_credit = 6300
+            max_credit = 630000
         else:
-            max_credit = 7100
+            max_credit = 710000
         
-        # Phase-in and phase-out (simplified)
-        if earned_income < 10000:
-            credit_rate = 0.4 if num_children > 0 else 0.075
-            return min(Decimal(str(max_credit)), earned_income * Decimal(str(credit_rate)))
+        # Phase-in and phase-out (simplified); credit rate in RATE_SCALE units
+        if earned_income < 1000000:
+            credit_rate = 4000 if num_children > 0 else 750
+            return min(max_credit, round_div(earned_income * credit_rate, RATE_SCALE))
         
-        return Decimal(str(max_credit))
+        return max_credit
     
-    def _calculate_education_credits(self, education_expenses: Decimal, agi: Decimal) -> Decimal:
-        """Calculate education credits (simplified American Opportunity Credit)"""
+    def _calculate_education_credits(self, education_expenses: int, agi: int) -> int:
+        """Calculate education credits (simplified American Opportunity Credit), in cents"""
         # Simplified calculation - actual implementation would be more complex
-        max_credit = Decimal('2500')
+        max_credit = 250000
         
         # Income phase-out
-        if agi > 80000:  # Single filer threshold
-            return Decimal('0')
+        if agi > 8000000:  # Single filer threshold
+            return 0
         
         # Credit calculation: 100% of first $2000, 25% of next $2000
-        if education_expenses <= 2000:
+        if education_expenses <= 200000:
             return education_expenses
-        elif education_expenses <= 4000:
-            return Decimal('2000') + (education_expenses - Decimal('2000')) * Decimal('0.25')
+        elif education_expenses <= 400000:
+            return 200000 + round_div(education_expenses - 200000, 4)
         else:
             return max_credit
     
-    def _calculate_other_taxes(self, taxpayer_data: dict) -> Decimal:
-        """Calculate other taxes (self-employment, etc.)"""
-        other_taxes = Decimal('0')
+    def _calculate_other_taxes(self, taxpayer_data: dict, profile: _StatusProfile,
+                               total_medicare_wages: int) -> int:
+        """Calculate other taxes (self-employment, etc.), in cents"""
+        other_taxes = 0
         
         # Self-employment tax
-        se_income = Decimal(str(taxpayer_data.get('self_employment_income', 0)))
+        se_income = to_cents(taxpayer_data.get('self_employment_income', 0))
         if se_income > 0:
             se_tax = self._calculate_self_employment_tax(se_income)
             other_taxes += se_tax
         
         # Additional Medicare tax
-        income_sources = taxpayer_data.get('income_sources', {})
-        total_medicare_wages = sum(
-            Decimal(str(w2.get('medicare_wages', 0)))
-            for w2 in income_sources.get('w2_forms', [])
-        )
-        
-        filing_status = taxpayer_data['filing_status']
-        medicare_threshold = 250000 if filing_status == 'married_filing_jointly' else 200000
+        medicare_threshold = profile.additional_medicare_threshold
         
         if total_medicare_wages > medicare_threshold:
-            additional_medicare = (total_medicare_wages - medicare_threshold) * Decimal('0.009')
+            additional_medicare = round_div(
+                (total_medicare_wages - medicare_threshold) * self._additional_medicare_rate,
+                RATE_SCALE
+            )
             other_taxes += additional_medicare
         
         return other_taxes
     
-    def _calculate_self_employment_tax(self, se_income: Decimal) -> Decimal:
-        """Calculate self-employment tax"""
-        # 92.35% of SE income is subject to SE tax
-        se_tax_income = se_income * Decimal('0.9235')
+    def _calculate_self_employment_tax(self, se_income: int) -> int:
+        """Calculate self-employment tax, in cents"""
+        if se_income <= 0:
+            return 0
+        
+        # 92.35% of SE income is subject to SE tax; kept in cents * RATE_SCALE
+        se_tax_income = se_income * self._se_income_factor
         
         # Social Security portion (up to wage base)
-        ss_wage_base = Decimal('160200')  # 2024 amount
-        ss_income = min(se_tax_income, ss_wage_base)
-        ss_tax = ss_income * Decimal('0.124')  # 12.4%
+        ss_income = min(se_tax_income, self._se_ss_wage_base)
+        ss_tax = ss_income * self._se_ss_rate
         
         # Medicare portion (no limit)
-        medicare_tax = se_tax_income * Decimal('0.029')  # 2.9%
+        medicare_tax = se_tax_income * self._se_medicare_rate
         
-        return ss_tax + medicare_tax
+        return round_div(ss_tax + medicare_tax, RATE_SCALE * RATE_SCALE)
     
-    def _calculate_total_payments(self, taxpayer_data: dict) -> Decimal:
-        """Calculate total tax payments and withholdings"""
-        income_sources = taxpayer_data.get('income_sources', {})
-        
-        # Federal withholding from W-2s
-        federal_withholding = sum(
-            Decimal(str(w2.get('federal_income_tax_withheld', 0)))
-            for w2 in income_sources.get('w2_forms', [])
-        )
-        
-        # Federal withholding from 1099s
-        federal_withholding_1099 = sum(
-            Decimal(str(form_1099.get('federal_income_tax_withheld', 0)))
-            for form_1099 in income_sources.get('1099_forms', [])
-        )
-        
+    def _calculate_total_payments(self, taxpayer_data: dict, federal_withholding: int,
+                                  federal_withholding_1099: int) -> int:
+        """Calculate total tax payments and withholdings, in cents"""
         # Estimated tax payments
         estimated_payments = sum(
-            Decimal(str(payment))
+            to_cents(payment)
             for payment in taxpayer_data.get('estimated_payments', [])
         )
         
@@ -373,44 +525,42 @@ class PayrollTaxCalculator:
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
         self.rates = PAYROLL_TAX_RATES[tax_year]
+        
+        # Employee rates in RATE_SCALE units and the wage base in cents
+        self._ss_wage_base = to_cents(self.rates['social_security_wage_base'])
+        self._ss_rate = to_units(self.rates['social_security_rate'], RATE_SCALE)
+        self._medicare_rate = to_units(self.rates['medicare_rate'], RATE_SCALE)
     
     def calculate(self, taxpayer_data: dict) -> dict:
         """Calculate payroll taxes"""
         income_sources = taxpayer_data.get('income_sources', {})
         
-        total_ss_wages = Decimal('0')
-        total_medicare_wages = Decimal('0')
-        total_ss_withheld = Decimal('0')
-        total_medicare_withheld = Decimal('0')
-        
-        # Sum from all W-2s
-        for w2 in income_sources.get('w2_forms', []):
-            total_ss_wages += Decimal(str(w2.get('social_security_wages', 0)))
-            total_medicare_wages += Decimal(str(w2.get('medicare_wages', 0)))
-            total_ss_withheld += Decimal(str(w2.get('social_security_tax_withheld', 0)))
-            total_medicare_withheld += Decimal(str(w2.get('medicare_tax_withheld', 0)))
+        # Sum from all W-2s, in cents
+        total_ss_wages, total_medicare_wages, total_ss_withheld, total_medicare_withheld = _form_totals(
+            income_sources.get('w2_forms', []),
+            _PAYROLL_W2_FIELDS
+        )
         
         # Calculate correct payroll tax amounts
-        ss_wage_base = self.rates['social_security_wage_base']
-        limited_ss_wages = min(total_ss_wages, ss_wage_base)
+        limited_ss_wages = min(total_ss_wages, self._ss_wage_base)
         
-        correct_ss_tax = limited_ss_wages * self.rates['social_security_rate']
-        correct_medicare_tax = total_medicare_wages * self.rates['medicare_rate']
+        correct_ss_tax = round_div(limited_ss_wages * self._ss_rate, RATE_SCALE)
+        correct_medicare_tax = round_div(total_medicare_wages * self._medicare_rate, RATE_SCALE)
         
         # Calculate any additional amounts owed or overpaid
         ss_difference = correct_ss_tax - total_ss_withheld
         medicare_difference = correct_medicare_tax - total_medicare_withheld
         
         return {
-            'social_security_wages': round_to_cents(total_ss_wages),
-            'medicare_wages': round_to_cents(total_medicare_wages),
-            'social_security_tax_withheld': round_to_cents(total_ss_withheld),
-            'medicare_tax_withheld': round_to_cents(total_medicare_withheld),
-            'correct_social_security_tax': round_to_cents(correct_ss_tax),
-            'correct_medicare_tax': round_to_cents(correct_medicare_tax),
-            'social_security_difference': round_to_cents(ss_difference),
-            'medicare_difference': round_to_cents(medicare_difference),
-            'total_payroll_tax_difference': round_to_cents(ss_difference + medicare_difference)
+            'social_security_wages': from_cents(total_ss_wages),
+            'medicare_wages': from_cents(total_medicare_wages),
+            'social_security_tax_withheld': from_cents(total_ss_withheld),
+            'medicare_tax_withheld': from_cents(total_medicare_withheld),
+            'correct_social_security_tax': from_cents(correct_ss_tax),
+            'correct_medicare_tax': from_cents(correct_medicare_tax),
+            'social_security_difference': from_cents(ss_difference),
+            'medicare_difference': from_cents(medicare_difference),
+            'total_payroll_tax_difference': from_cents(ss_difference + medicare_difference)
         }
 
 class StateTaxCalculator:
@@ -419,53 +569,58 @@ class StateTaxCalculator:
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
     
-    def calculate(self, taxpayer_data: dict, state: str) -> dict:
-        """Calculate state income tax (simplified)"""
+    def calculate(self, taxpayer_data: dict, state: str,
+                  federal_result: Optional[dict] = None) -> dict:
+        """
+        Calculate state income tax (simplified)
+        
+        federal_result, if given, is FederalTaxCalculator.calculate output for
+        the same taxpayer_data and is used instead of recomputing it
+        """
         # This is a simplified implementation
         # prod implementation would have state-specific rules
         
-        from .constants import STATE_TAX_RATES
-        
-        if state in ['AK', 'FL', 'NV', 'NH', 'SD', 'TN', 'TX', 'WA', 'WY']:
+        if state in NO_INCOME_TAX_STATES:
             # No state income tax
             return {
                 'state': state,
-                'state_tax_liability': Decimal('0'),
-                'state_withholding': Decimal('0'),
-                'state_refund': Decimal('0'),
-                'state_owe': Decimal('0'),
+                'state_tax_liability': _ZERO,
+                'state_withholding': _ZERO,
+                'state_refund': _ZERO,
+                'state_owe': _ZERO,
                 'has_income_tax': False
             }
         
         # Get federal AGI
-        federal_calc = FederalTaxCalculator(self.tax_year)
-        federal_result = federal_calc.calculate(taxpayer_data)
-        agi = federal_result['agi']
+        if federal_result is None:
+            federal_result = FederalTaxCalculator.get(self.tax_year).calculate(taxpayer_data)
+        agi = to_cents(federal_result['agi'])
         
-        # Apply state tax rate (simplified)
-        state_rate = STATE_TAX_RATES.get(state, Decimal('0.05'))
-        state_tax = agi * state_rate
+        # Apply state tax rate (simplified), in cents
+        state_rate = state_rate_units(state)
+        state_tax = round_div(agi * state_rate, RATE_SCALE)
         
         # Get state withholding
         income_sources = taxpayer_data.get('income_sources', {})
         state_withholding = sum(
-            Decimal(str(w2.get('state_income_tax_withheld', 0)))
+            to_cents(w2.get('state_income_tax_withheld', 0))
             for w2 in income_sources.get('w2_forms', [])
         )
         
         # Calculate refund/owe
-        refund_amount = max(Decimal('0'), state_withholding - state_tax)
-        owe_amount = max(Decimal('0'), state_tax - state_withholding)
+        balance = state_withholding - state_tax
+        refund_amount, owe_amount = (balance, 0) if balance >= 0 else (0, -balance)
         
         return {
             'state': state,
-            'state_agi': round_to_cents(agi),
-            'state_tax_liability': round_to_cents(state_tax),
-            'state_withholding': round_to_cents(state_withholding),
-            'state_refund': round_to_cents(refund_amount),
-            'state_owe': round_to_cents(owe_amount),
+            'state_agi': from_cents(agi),
+            'state_tax_liability': from_cents(state_tax),
+            'state_withholding': from_cents(state_withholding),
+            'state_refund': from_cents(refund_amount),
+            'state_owe': from_cents(owe_amount),
             'has_income_tax': True,
-            'state_tax_rate': round_to_cents(state_rate * 100)
+            # RATE_SCALE units are hundredths of a percent
+            'state_tax_rate': from_cents(state_rate)
         }
 
 class TaxSummaryCalculator:
@@ -473,19 +628,21 @@ class TaxSummaryCalculator:
     
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
-        self.federal_calc = FederalTaxCalculator(tax_year)
+        self.federal_calc = FederalTaxCalculator.get(tax_year)
         self.state_calc = StateTaxCalculator(tax_year)
         self.payroll_calc = PayrollTaxCalculator(tax_year)
     
-    def calculate_complete_return(self, taxpayer_data: dict) -> dict:
-        """Calculate complete tax return summary"""
+    def calculate_complete_return(self, taxpayer_data: dict,
+                                  federal_result: Optional[dict] = None) -> dict:
+        """Calculate complete tax return summary, reusing federal_result if already computed"""
         try:
             # Federal taxes
-            federal_result = self.federal_calc.calculate(taxpayer_data)
+            if federal_result is None:
+                federal_result = self.federal_calc.calculate(taxpayer_data)
             
             # State taxes
             state = taxpayer_data.get('state', 'CA')
-            state_result = self.state_calc.calculate(taxpayer_data, state)
+            state_result = self.state_calc.calculate(taxpayer_data, state, federal_result=federal_result)
             
             # Payroll taxes
             payroll_result = self.payroll_calc.calculate(taxpayer_data)
@@ -513,29 +670,47 @@ class TaxSummaryCalculator:
                     'total_withholding': round_to_cents(total_withholding),
                     'total_refund': round_to_cents(total_refund),
                     'total_owe': round_to_cents(total_owe),
-                    'effective_tax_rate': round_to_cents(
-                        (total_tax_liability / federal_result['agi'] * 100) 
-                        if federal_result['agi'] > 0 else Decimal('0')
+                    'effective_tax_rate': _percent(
+                        to_cents(total_tax_liability),
+                        to_cents(federal_result['agi'])
                     )
                 },
                 'tax_year': self.tax_year,
-                'calculation_timestamp': str(Decimal('0'))  # Would use datetime in during implementation
+                'calculation_timestamp': '0'  # Would use datetime in during implementation
             }
             
         except Exception as e:
             logger.error(f"Complete return calculation error: {str(e)}")
             raise
     
-    def estimate_quarterly_payments(self, taxpayer_data: dict) -> dict:
-        """Estimate quarterly tax payments"""
-        federal_result = self.federal_calc.calculate(taxpayer_data)
+    def calculate_complete_return_batch(self, scenarios: List[dict]) -> List[dict]:
+        """
+        Calculate complete returns for many taxpayer scenarios, in input order
+        
+        Federal results come from one FederalTaxCalculator.calculate_batch
+        call, so each filing status is resolved once for the whole batch
+        """
+        federal_results = self.federal_calc.calculate_batch(scenarios)
+        calculate = self.calculate_complete_return
+        return [
+            calculate(taxpayer_data, federal_result)
+            for taxpayer_data, federal_result in zip(scenarios, federal_results)
+        ]
+    
+    def estimate_quarterly_payments(self, taxpayer_data: dict,
+                                    federal_result: Optional[dict] = None) -> dict:
+        """Estimate quarterly tax payments, reusing federal_result if already computed"""
+        if federal_result is None:
+            federal_result = self.federal_calc.calculate(taxpayer_data)
         
         # Estimate next year's tax liability
         estimated_annual_tax = federal_result['total_tax_liability']
         
         # Safe harbor: 100% of current year (110% if AGI > $150k)
-        safe_harbor_percentage = 1.1 if federal_result['agi'] > 150000 else 1.0
-        safe_harbor_amount = estimated_annual_tax * Decimal(str(safe_harbor_percentage))
+        if federal_result['agi'] > _SAFE_HARBOR_AGI_THRESHOLD:
+            safe_harbor_amount = estimated_annual_tax * _SAFE_HARBOR_HIGH
+        else:
+            safe_harbor_amount = estimated_annual_tax * _SAFE_HARBOR_LOW
         
         # Quarterly payment
         quarterly_payment = safe_harbor_amount / 4
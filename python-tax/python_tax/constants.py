@@ -3,7 +3,11 @@ Tax constants and lookup tables for US federal and state taxes
 Based on official IRS publications and tax law
 """
 
+import re
+import sys
+from bisect import bisect_left
 from decimal import Decimal
+from enum import IntEnum
 from typing import Dict, List, Tuple, Any
 
 # Current tax year
@@ -18,6 +22,24 @@ FILING_STATUSES = [
     'qualifying_widow'
 ]
 
+class FilingStatus(IntEnum):
+    """Filing status as a small int; values index FILING_STATUSES"""
+    SINGLE = 0
+    MARRIED_FILING_JOINTLY = 1
+    MARRIED_FILING_SEPARATELY = 2
+    HEAD_OF_HOUSEHOLD = 3
+    QUALIFYING_WIDOW = 4
+    
+    @classmethod
+    def parse(cls, value) -> 'FilingStatus':
+        """FilingStatus for a member or a FILING_STATUSES string"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[value.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Invalid filing status: {value!r}") from None
+
 # Tax brackets for 2024 (rates are marginal tax rates)
 # Format: (min_income, max_income, rate)
 TAX_BRACKETS = {
@@ -39,6 +61,33 @@ TAX_BRACKETS = {
             (Decimal('364200'), Decimal('462500'), Decimal('0.32')),
             (Decimal('462500'), Decimal('693750'), Decimal('0.35')),
             (Decimal('693750'), Decimal('999999999'), Decimal('0.37'))
+        ],
+        'married_filing_separately': [
+            (Decimal('0'), Decimal('11600'), Decimal('0.10')),
+            (Decimal('11600'), Decimal('47150'), Decimal('0.12')),
+            (Decimal('47150'), Decimal('100525'), Decimal('0.22')),
+            (Decimal('100525'), Decimal('191950'), Decimal('0.24')),
+            (Decimal('191950'), Decimal('243725'), Decimal('0.32')),
+            (Decimal('243725'), Decimal('365600'), Decimal('0.35')),
+            (Decimal('365600'), Decimal('999999999'), Decimal('0.37'))
+        ],
+        'head_of_household': [
+            (Decimal('0'), Decimal('16550'), Decimal('0.10')),
+            (Decimal('16550'), Decimal('63100'), Decimal('0.12')),
+            (Decimal('63100'), Decimal('100500'), Decimal('0.22')),
+            (Decimal('100500'), Decimal('191950'), Decimal('0.24')),
+            (Decimal('191950'), Decimal('243700'), Decimal('0.32')),
+            (Decimal('243700'), Decimal('609350'), Decimal('0.35')),
+            (Decimal('609350'), Decimal('999999999'), Decimal('0.37'))
+        ],
+        'qualifying_widow': [
+            (Decimal('0'), Decimal('22000'), Decimal('0.10')),
+            (Decimal('22000'), Decimal('89450'), Decimal('0.12')),
+            (Decimal('89450'), Decimal('190750'), Decimal('0.22')),
+            (Decimal('190750'), Decimal('364200'), Decimal('0.24')),
+            (Decimal('364200'), Decimal('462500'), Decimal('0.32')),
+            (Decimal('462500'), Decimal('693750'), Decimal('0.35')),
+            (Decimal('693750'), Decimal('999999999'), Decimal('0.37'))
         ]
     }
 }
@@ -86,16 +135,16 @@ CHILD_TAX_CREDIT_AMOUNTS = {
 EARNED_INCOME_CREDIT_TABLE = {
     2024: {
         'single': {
-            0: {'max_credit': Decimal('600'), 'phase_out_start': Decimal('10000'), 'phase_out_end': Decimal('17640')},
-            1: {'max_credit': Decimal('3800'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('47915')},
-            2: {'max_credit': Decimal('6300'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('53865')},
-            3: {'max_credit': Decimal('7100'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('57414')}
+            0: {'max_credit': Decimal('600'), 'phase_in_rate': Decimal('0.0765'), 'phase_out_start': Decimal('10000'), 'phase_out_end': Decimal('17640')},
+            1: {'max_credit': Decimal('3800'), 'phase_in_rate': Decimal('0.34'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('47915')},
+            2: {'max_credit': Decimal('6300'), 'phase_in_rate': Decimal('0.40'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('53865')},
+            3: {'max_credit': Decimal('7100'), 'phase_in_rate': Decimal('0.45'), 'phase_out_start': Decimal('12000'), 'phase_out_end': Decimal('57414')}
         },
         'married_filing_jointly': {
-            0: {'max_credit': Decimal('600'), 'phase_out_start': Decimal('16000'), 'phase_out_end': Decimal('23640')},
-            1: {'max_credit': Decimal('3800'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('53915')},
-            2: {'max_credit': Decimal('6300'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('59865')},
-            3: {'max_credit': Decimal('7100'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('63414')}
+            0: {'max_credit': Decimal('600'), 'phase_in_rate': Decimal('0.0765'), 'phase_out_start': Decimal('16000'), 'phase_out_end': Decimal('23640')},
+            1: {'max_credit': Decimal('3800'), 'phase_in_rate': Decimal('0.34'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('53915')},
+            2: {'max_credit': Decimal('6300'), 'phase_in_rate': Decimal('0.40'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('59865')},
+            3: {'max_credit': Decimal('7100'), 'phase_in_rate': Decimal('0.45'), 'phase_out_start': Decimal('18000'), 'phase_out_end': Decimal('63414')}
         }
     }
 }
@@ -156,7 +205,8 @@ STATE_TAX_RATES = {
 }
 
 # States with no income tax
-NO_INCOME_TAX_STATES = ['AK', 'FL', 'NV', 'NH', 'SD', 'TN', 'TX', 'WA', 'WY']
+NO_INCOME_TAX_STATES = frozenset({'AK', 'FL', 'NV', 'NH', 'SD', 'TN', 'TX', 'WA', 'WY'})
+NO_INCOME_TAX_STATES_ORDERED = tuple(sorted(NO_INCOME_TAX_STATES))
 
 # Alternative Minimum Tax (AMT) exemption amounts for 2024
 AMT_EXEMPTIONS = {
@@ -192,66 +242,12 @@ IRS_STATUS_CODES = {
 # Form validation rules
 FORM_VALIDATION_RULES = {
     'ssn': {
-        'pattern': r'^\d{3}-\d{2}-\d{4}Decimal('364200'), Decimal('462500'), Decimal('0.32')),
-            (Decimal('462500'), Decimal('693750'), Decimal('0.35')),
-            (Decimal('693750'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'married_filing_separately': [
-            (Decimal('0'), Decimal('11000'), Decimal('0.10')),
-            (Decimal('11000'), Decimal('44725'), Decimal('0.12')),
-            (Decimal('44725'), Decimal('95375'), Decimal('0.22')),
-            (Decimal('95375'), Decimal('182050'), Decimal('0.24')),
-            (Decimal('182050'), Decimal('231250'), Decimal('0.32')),
-            (Decimal('231250'), Decimal('346875'), Decimal('0.35')),
-            (Decimal('346875'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'head_of_household': [
-            (Decimal('0'), Decimal('15700'), Decimal('0.10')),
-            (Decimal('15700'), Decimal('59850'), Decimal('0.12')),
-            (Decimal('59850'), Decimal('95350'), Decimal('0.22')),
-            (Decimal('95350'), Decimal('197050'), Decimal('0.24')),
-            (Decimal('197050'), Decimal('250525'), Decimal('0.32')),
-            (Decimal('250525'), Decimal('609350'), Decimal('0.35')),
-            (Decimal('609350'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'qualifying_widow': [
-            (Decimal('0'), Decimal('22000'), Decimal('0.10')),
-            (Decimal('22000'), Decimal('89450'), Decimal('0.12')),
-            (Decimal('89450'), Decimal('190750'), Decimal('0.22')),
-            (Decimal('190750'), Decimal('364200'), Decimal('0.24')),
-            (,
+        'pattern': re.compile(r'^\d{3}-\d{2}-\d{4}$'),
         'required': True,
         'length': 11
     },
     'ein': {
-        'pattern': r'^\d{2}-\d{7}Decimal('364200'), Decimal('462500'), Decimal('0.32')),
-            (Decimal('462500'), Decimal('693750'), Decimal('0.35')),
-            (Decimal('693750'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'married_filing_separately': [
-            (Decimal('0'), Decimal('11000'), Decimal('0.10')),
-            (Decimal('11000'), Decimal('44725'), Decimal('0.12')),
-            (Decimal('44725'), Decimal('95375'), Decimal('0.22')),
-            (Decimal('95375'), Decimal('182050'), Decimal('0.24')),
-            (Decimal('182050'), Decimal('231250'), Decimal('0.32')),
-            (Decimal('231250'), Decimal('346875'), Decimal('0.35')),
-            (Decimal('346875'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'head_of_household': [
-            (Decimal('0'), Decimal('15700'), Decimal('0.10')),
-            (Decimal('15700'), Decimal('59850'), Decimal('0.12')),
-            (Decimal('59850'), Decimal('95350'), Decimal('0.22')),
-            (Decimal('95350'), Decimal('197050'), Decimal('0.24')),
-            (Decimal('197050'), Decimal('250525'), Decimal('0.32')),
-            (Decimal('250525'), Decimal('609350'), Decimal('0.35')),
-            (Decimal('609350'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'qualifying_widow': [
-            (Decimal('0'), Decimal('22000'), Decimal('0.10')),
-            (Decimal('22000'), Decimal('89450'), Decimal('0.12')),
-            (Decimal('89450'), Decimal('190750'), Decimal('0.22')),
-            (Decimal('190750'), Decimal('364200'), Decimal('0.24')),
-            (,
+        'pattern': re.compile(r'^\d{2}-\d{7}$'),
         'required': True,
         'length': 10
     },
@@ -431,6 +427,12 @@ STATE_ABBREVIATIONS = {
     'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
 }
 
+# Reverse lookup, state name -> abbreviation. Abbreviations are identifier-
+# like literals and so already interned; names with spaces are not, so
+# intern them for identity-fast key comparisons in both tables
+STATE_ABBREVIATIONS = {abbrev: sys.intern(name) for abbrev, name in STATE_ABBREVIATIONS.items()}
+STATE_NAME_TO_ABBREV = {name: abbrev for abbrev, name in STATE_ABBREVIATIONS.items()}
+
 # Tax form due dates
 TAX_DUE_DATES = {
     2024: {
@@ -458,32 +460,162 @@ ADJUSTMENT_LIMITS = {
         'hsa_individual': Decimal('4150'),
         'hsa_family': Decimal('8300')
     }
-}Decimal('364200'), Decimal('462500'), Decimal('0.32')),
-            (Decimal('462500'), Decimal('693750'), Decimal('0.35')),
-            (Decimal('693750'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'married_filing_separately': [
-            (Decimal('0'), Decimal('11000'), Decimal('0.10')),
-            (Decimal('11000'), Decimal('44725'), Decimal('0.12')),
-            (Decimal('44725'), Decimal('95375'), Decimal('0.22')),
-            (Decimal('95375'), Decimal('182050'), Decimal('0.24')),
-            (Decimal('182050'), Decimal('231250'), Decimal('0.32')),
-            (Decimal('231250'), Decimal('346875'), Decimal('0.35')),
-            (Decimal('346875'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'head_of_household': [
-            (Decimal('0'), Decimal('15700'), Decimal('0.10')),
-            (Decimal('15700'), Decimal('59850'), Decimal('0.12')),
-            (Decimal('59850'), Decimal('95350'), Decimal('0.22')),
-            (Decimal('95350'), Decimal('197050'), Decimal('0.24')),
-            (Decimal('197050'), Decimal('250525'), Decimal('0.32')),
-            (Decimal('250525'), Decimal('609350'), Decimal('0.35')),
-            (Decimal('609350'), Decimal('999999999'), Decimal('0.37'))
-        ],
-        'qualifying_widow': [
-            (Decimal('0'), Decimal('22000'), Decimal('0.10')),
-            (Decimal('22000'), Decimal('89450'), Decimal('0.12')),
-            (Decimal('89450'), Decimal('190750'), Decimal('0.22')),
-            (Decimal('190750'), Decimal('364200'), Decimal('0.24')),
-            ]
-            }
+}
+
+# Money and rates in the derived tables below are integers: cents, and rates
+# in 1/RATE_SCALE units (basis points), so bracket math runs on plain ints
+RATE_SCALE = 10000
+
+# Structure-of-arrays form of a bracket schedule:
+# (lower_cents, upper_cents, rate_units, intercept), piecewise linear so that
+# the tax on income x in bracket i is intercept[i] + x * rate_units[i], in
+# cents * RATE_SCALE
+BracketArrays = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]
+
+def to_units(value: Decimal, scale: int) -> int:
+    """Scale a Decimal to an exact integer, rejecting values that don't fit"""
+    units = Decimal(str(value)) * scale
+    if units != units.to_integral_value():
+        raise ValueError(f"{value} is not a multiple of 1/{scale}")
+    return int(units)
+
+def compile_brackets(brackets) -> BracketArrays:
+    """Convert (min_income, max_income, rate) tuples to integer BracketArrays"""
+    lowers, uppers, rates, intercepts = [], [], [], []
+    base_tax = 0
+    
+    for min_income, max_income, rate in brackets:
+        lower = to_units(min_income, 100)
+        upper = to_units(max_income, 100)
+        rate_units = to_units(rate, RATE_SCALE)
+        
+        lowers.append(lower)
+        uppers.append(upper)
+        rates.append(rate_units)
+        # base_tax is the tax on all income below lower
+        intercepts.append(base_tax - lower * rate_units)
+        base_tax += (upper - lower) * rate_units
+    
+    return tuple(lowers), tuple(uppers), tuple(rates), tuple(intercepts)
+
+# TAX_BRACKETS and STANDARD_DEDUCTIONS pre-converted once at import, keyed
+# by FilingStatus
+TAX_BRACKET_ARRAYS = {
+    year: {
+        FilingStatus.parse(status): compile_brackets(brackets)
+        for status, brackets in by_status.items()
+    }
+    for year, by_status in TAX_BRACKETS.items()
+}
+
+STANDARD_DEDUCTION_CENTS = {
+    year: {
+        FilingStatus.parse(status): to_units(amount, 100)
+        for status, amount in by_status.items()
+    }
+    for year, by_status in STANDARD_DEDUCTIONS.items()
+}
+
+
+def get_bracket_arrays(year: int, filing_status) -> BracketArrays:
+    """Return the compiled bracket arrays for a tax year and filing status"""
+    return TAX_BRACKET_ARRAYS[year][FilingStatus.parse(filing_status)]
+
+# Flat state rates in RATE_SCALE units, and the rate for unlisted states
+STATE_TAX_RATE_UNITS = {
+    state: to_units(rate, RATE_SCALE) for state, rate in STATE_TAX_RATES.items()
+}
+DEFAULT_STATE_TAX_RATE_UNITS = 500
+
+
+def state_rate_units(state: str) -> int:
+    """Return a state's flat income tax rate in RATE_SCALE units"""
+    return STATE_TAX_RATE_UNITS.get(state, DEFAULT_STATE_TAX_RATE_UNITS)
+
+# Current-year tables bound to module names, so code that pins 2024 (or
+# falls back to it) looks them up without going through the year dicts
+TAX_BRACKETS_2024 = TAX_BRACKETS[TAX_YEAR_2024]
+STD_DED_2024 = STANDARD_DEDUCTIONS[TAX_YEAR_2024]
+PAYROLL_2024 = PAYROLL_TAX_RATES[TAX_YEAR_2024]
+CTC_2024 = CHILD_TAX_CREDIT_AMOUNTS[TAX_YEAR_2024]
+SE_FACTORS_2024 = SE_TAX_FACTORS[TAX_YEAR_2024]
+NIIT_RATE_2024 = NIIT_THRESHOLDS[TAX_YEAR_2024]['rate']
+
+
+def is_ssn(value: str) -> bool:
+    """Check the FORM_VALIDATION_RULES['ssn'] format (ddd-dd-dddd) without the regex engine"""
+    return (
+        len(value) == 11 and value.isascii()
+        and value[3] == '-' and value[6] == '-'
+        and value[:3].isdigit() and value[4:6].isdigit() and value[7:].isdigit()
+    )
+
+# EARNED_INCOME_CREDIT_TABLE as parallel tuples indexed by number of
+# qualifying children (capped at EIC_MAX_CHILDREN):
+# (max_credit, phase_out_start, phase_out_end) in cents and phase_in_rate in
+# RATE_SCALE units. Every status other than married filing jointly uses the
+# single schedule
+EicArrays = Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]
+EIC_MAX_CHILDREN = 3
+
+def _compile_eic(by_children) -> EicArrays:
+    """Convert one EARNED_INCOME_CREDIT_TABLE schedule to EicArrays"""
+    rows = [by_children[n] for n in range(EIC_MAX_CHILDREN + 1)]
+    return tuple(
+        tuple(to_units(row[field], scale) for row in rows)
+        for field, scale in (
+            ('max_credit', 100),
+            ('phase_out_start', 100),
+            ('phase_out_end', 100),
+            ('phase_in_rate', RATE_SCALE),
+        )
+    )
+
+EIC_ARRAYS = {
+    year: {
+        status: _compile_eic(
+            by_status['married_filing_jointly']
+            if status == FilingStatus.MARRIED_FILING_JOINTLY
+            else by_status['single']
+        )
+        for status in FilingStatus
+    }
+    for year, by_status in EARNED_INCOME_CREDIT_TABLE.items()
+}
+
+# CAPITAL_GAINS_RATES long-term thresholds flattened per FilingStatus:
+# (top of the 0% bracket, top of the 15% bracket) in cents, with the rates
+# for income up to, within and above them in RATE_SCALE units. Qualifying
+# widow(er)s use the married filing jointly thresholds
+_LTCG_THRESHOLD_KEYS = {
+    FilingStatus.SINGLE: 'single_threshold',
+    FilingStatus.MARRIED_FILING_JOINTLY: 'married_jointly_threshold',
+    FilingStatus.MARRIED_FILING_SEPARATELY: 'married_separately_threshold',
+    FilingStatus.HEAD_OF_HOUSEHOLD: 'head_of_household_threshold',
+    FilingStatus.QUALIFYING_WIDOW: 'married_jointly_threshold'
+}
+
+LTCG_THRESHOLDS = {
+    year: {
+        status: tuple(
+            to_units(rates['long_term'][bracket][key], 100)
+            for bracket in ('rate_0', 'rate_15')
+        )
+        for status, key in _LTCG_THRESHOLD_KEYS.items()
+    }
+    for year, rates in CAPITAL_GAINS_RATES.items()
+}
+
+LTCG_RATE_UNITS = {
+    year: tuple(
+        to_units(rates['long_term'][bracket]['rate'], RATE_SCALE)
+        for bracket in ('rate_0', 'rate_15', 'rate_20')
+    )
+    for year, rates in CAPITAL_GAINS_RATES.items()
+}
+
+
+def ltcg_rate_units(taxable_income_cents: int, filing_status, tax_year: int = 2024) -> int:
+    """Return the long-term capital gains rate for taxable income, in RATE_SCALE units"""
+    thresholds = LTCG_THRESHOLDS[tax_year][FilingStatus.parse(filing_status)]
+    return LTCG_RATE_UNITS[tax_year][bisect_left(thresholds, taxable_income_cents)]
@@ -2,13 +2,17 @@
 Tax form definitions and field mappings
 """
 
+from typing import ClassVar, Tuple
+
 class BaseForm:
+    # Field names shared by every instance; subclasses override
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    
     def __init__(self, tax_year):
         self.tax_year = tax_year
     
     def get_field_names(self):
-        return []
+        return type(self).FIELD_NAMES
 
 class Form1040(BaseForm):
-    def get_field_names(self):
-        return ['filing_status', 'total_income', 'agi', 'taxable_income']
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = ('filing_status', 'total_income', 'agi', 'taxable_income')
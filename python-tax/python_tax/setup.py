@@ -1,17 +1,12 @@
 # python-tax/setup.py
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
 setup(
     name="python-tax",
     version="0.1.0",
     author="Ope Olatunji",
     author_email="ope.olatunji@taxmeai.com",
     description="US Federal and State Tax Calculation Library",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
     url="https://github.com/taxmeai/e-file-tax-libraries/python-tax",
     packages=find_packages(),
     classifiers=[
@@ -1,29 +1,204 @@
 """
 Utility functions for tax calculations
+
+Money is carried internally as integer cents and rates as integers scaled
+by RATE_SCALE, so bracket arithmetic runs on plain ints and stays exact.
+Decimal values are only built at the public function boundaries.
 """
 
+from bisect import bisect_right
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+from .constants import (
+    RATE_SCALE,
+    BracketArrays,
+    FilingStatus,
+    EIC_ARRAYS,
+    EIC_MAX_CHILDREN,
+    TAX_BRACKETS,
+    TAX_BRACKET_ARRAYS,
+    compile_brackets
+)
+
+_ZERO = Decimal('0')
+_CENT = Decimal('0.01')
+
+def to_cents(amount) -> int:
+    """Convert a money amount to integer cents, rounding half up"""
+    # Whole-dollar ints (most form fields) and Decimals skip the str() round trip
+    amount_type = type(amount)
+    if amount_type is int:
+        return amount * 100
+    if amount_type is not Decimal:
+        amount = Decimal(str(amount))
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP) * 100)
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a Decimal dollar amount"""
+    return Decimal(cents).scaleb(-2)
+
+def round_div(numerator: int, denominator: int) -> int:
+    """Integer numerator / denominator, rounded half up (away from zero)"""
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+# Compiled arrays for caller-supplied bracket schedules, keyed by tuple(brackets)
+_bracket_arrays = lru_cache(maxsize=64)(compile_brackets)
+
+# The TAX_BRACKETS schedules themselves, mapped by identity to the arrays
+# compiled at import, so passing one skips hashing its Decimal tuples
+_KNOWN_BRACKET_ARRAYS = {
+    id(brackets): (brackets, TAX_BRACKET_ARRAYS[year][FilingStatus.parse(status)])
+    for year, by_status in TAX_BRACKETS.items()
+    for status, brackets in by_status.items()
+}
+
+def _arrays_for(brackets) -> BracketArrays:
+    """Compiled BracketArrays for a (min_income, max_income, rate) schedule"""
+    known = _KNOWN_BRACKET_ARRAYS.get(id(brackets))
+    if known is not None and known[0] is brackets:
+        return known[1]
+    # Rows may be lists (e.g. schedules loaded from JSON); key on tuples
+    return _bracket_arrays(tuple(map(tuple, brackets)))
+
+def apply_tax_brackets_scaled(income_cents: int, arrays: BracketArrays) -> int:
+    """Tax on income_cents under compiled arrays, in cents * RATE_SCALE units (unrounded)"""
+    lowers, uppers, rates, intercepts = arrays
+    
+    # Bracket containing the income: the last one whose lower bound is below it
+    i = bisect_right(lowers, income_cents) - 1
+    if i < 0:
+        return 0
+    
+    # Income above the top bracket is taxed up to its upper bound only
+    return intercepts[i] + min(income_cents, uppers[i]) * rates[i]
 
 def format_currency(amount):
     """Format amount as currency"""
-    return f"${Decimal(str(amount)):,.2f}"
+    return format_cents(to_cents(amount))
+
+# Forms repeat the same amounts (standard deductions, zero lines) often
+@lru_cache(maxsize=1024)
+def format_cents(cents: int) -> str:
+    """Format integer cents as currency"""
+    sign = '-' if cents < 0 else ''
+    dollars, cents = divmod(abs(cents), 100)
+    return f"${sign}{dollars:,}.{cents:02d}"
 
 def calculate_agi(income_data):
     """Calculate Adjusted Gross Income"""
-    return Decimal('0')
+    return _ZERO
 
 def calculate_taxable_income(agi, deductions):
-    """Calculate taxable income"""
-    return max(Decimal('0'), agi - deductions)
+    """
+    Calculate taxable income
+    
+    Int cents in (converted once at the caller's boundary) gives int cents
+    out without touching Decimal; Decimal amounts still work as before
+    """
+    taxable = agi - deductions
+    if taxable > 0:
+        return taxable
+    return 0 if type(taxable) is int else _ZERO
+
+def apply_tax_brackets(taxable_income, brackets, strict=False):
+    """
+    Apply tax brackets to income
+    
+    brackets is an ascending sequence of (min_income, max_income, rate)
+    tuples, as stored in TAX_BRACKETS. The tax is returned rounded half up
+    to the cent. strict=True walks the brackets in Decimal arithmetic
+    instead, without rounding income to cents, for auditing the integer
+    path
+    """
+    if strict:
+        return round_to_cents(_apply_tax_brackets_decimal(Decimal(str(taxable_income)), brackets))
+    
+    arrays = _arrays_for(brackets)
+    tax = apply_tax_brackets_scaled(to_cents(taxable_income), arrays)
+    
+    # cents * RATE_SCALE units -> dollars, rounded half up to the cent
+    return from_cents(round_div(tax, RATE_SCALE))
 
-def apply_tax_brackets(taxable_income, brackets):
-    """Apply tax brackets to income"""
-    return Decimal('0')
+def _apply_tax_brackets_decimal(taxable_income: Decimal, brackets) -> Decimal:
+    """Reference Decimal implementation of apply_tax_brackets"""
+    tax = _ZERO
+    for min_income, max_income, rate in brackets:
+        if taxable_income <= min_income:
+            break
+        tax += (min(taxable_income, max_income) - min_income) * rate
+    return tax
+
+def apply_tax_brackets_batch(incomes, brackets):
+    """
+    Apply the same tax brackets to many incomes
+    
+    The bracket arrays are compiled once for the whole batch; returns the
+    Decimal tax for each income, rounded to cents, in input order
+    """
+    arrays = _arrays_for(brackets)
+    return [
+        from_cents(round_div(apply_tax_brackets_scaled(to_cents(income), arrays), RATE_SCALE))
+        for income in incomes
+    ]
+
+def apply_tax_brackets_batch_cents(incomes_cents, brackets):
+    """
+    Apply the same tax brackets to many incomes given as integer cents
+    
+    For bulk simulations that already hold amounts as cents: no Decimal is
+    built per income, and each tax is returned as int cents, rounded half up
+    """
+    arrays = _arrays_for(brackets)
+    return [
+        round_div(apply_tax_brackets_scaled(income, arrays), RATE_SCALE)
+        for income in incomes_cents
+    ]
+
+def compute_eic_batch(filing_statuses, num_children, earned_incomes, tax_year: int = 2024):
+    """
+    Earned Income Credit from EARNED_INCOME_CREDIT_TABLE for many taxpayers
+    
+    Takes parallel sequences of filing statuses, qualifying children and
+    earned income in int cents; returns each credit in int cents. The credit
+    phases in at phase_in_rate up to max_credit, which holds until
+    phase_out_start and then falls linearly to zero at phase_out_end. This
+    follows the table's schedule; FederalTaxCalculator keeps its own
+    simplified AGI-limit EIC, so the two can differ for the same return
+    
+    >>> compute_eic_batch(['single'] * 3, [1, 1, 1], [0, 500000, 2000000])
+    [0, 170000, 295356]
+    """
+    by_status = EIC_ARRAYS[tax_year]
+    parse = FilingStatus.parse
+    credits = []
+    for status, children, income in zip(filing_statuses, num_children, earned_incomes):
+        max_credits, starts, ends, phase_in_rates = by_status[parse(status)]
+        n = min(children, EIC_MAX_CHILDREN)
+        max_credit, start, end = max_credits[n], starts[n], ends[n]
+        if income >= end:
+            credits.append(0)
+            continue
+        credit = min(max_credit, round_div(income * phase_in_rates[n], RATE_SCALE))
+        if income > start:
+            credit = min(credit, round_div(max_credit * (end - income), end - start))
+        credits.append(credit)
+    return credits
 
 def calculate_credits(taxpayer_data):
     """Calculate tax credits"""
-    return {'total': Decimal('0')}
+    return {'total': _ZERO}
 
 def round_to_cents(amount):
     """Round to nearest cent"""
-    return Decimal(str(amount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    return _quantize_cents(str(amount))
+
+# Keyed by str(amount): the same amounts (standard deductions, per-child
+# credits) are rounded over and over
+@lru_cache(maxsize=256)
+def _quantize_cents(amount: str) -> Decimal:
+    """Decimal(amount) rounded half up to cents"""
+    return Decimal(amount).quantize(_CENT, rounding=ROUND_HALF_UP)
@@ -2,11 +2,12 @@
 Validation utilities for tax data
 """
 
+from .constants import is_ssn
+
 class TaxDataValidator:
     @staticmethod
     def validate_ssn(ssn):
-        # Implementation here
-        return True
+        return isinstance(ssn, str) and is_ssn(ssn)
 
 class FormValidator:
     @staticmethod
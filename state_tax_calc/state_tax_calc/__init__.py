@@ -10,9 +10,12 @@ This library provides:
 - State-specific deductions and credits
 """
 
-from typing import Dict, List, Any, Optional
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, TypedDict
+from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 from .calculators import (
     StateCalculatorFactory,
@@ -62,6 +65,81 @@ __version__ = "0.1.0"
 __author__ = "E-File Backend Team"
 __description__ = "US State Tax Calculation Library"
 
+# Frozen copies of the constants tables for the per-call membership checks,
+# whatever container types the constants module uses
+_NO_INCOME_TAX_STATES = frozenset(NO_INCOME_TAX_STATES)
+_STATE_CODES = frozenset(STATE_ABBREVIATIONS)
+
+# RECIPROCITY_AGREEMENTS flattened to (state1, state2) -> agreement, for
+# single-probe lookups
+_RECIPROCITY_PAIRS: Dict[Tuple[str, str], dict] = {
+    (state1, state2): agreement
+    for state1, agreements in RECIPROCITY_AGREEMENTS.items()
+    for state2, agreement in agreements.items()
+}
+_NO_AGREEMENTS = MappingProxyType({})
+
+_CENT = Decimal('0.01')
+
+def _to_cents(amount) -> int:
+    """Convert a Decimal/int/float money amount to integer cents, rounding half up"""
+    if type(amount) is int:
+        return amount * 100
+    if type(amount) is not Decimal:
+        amount = Decimal(str(amount))
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP) * 100)
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a Decimal dollar amount"""
+    return Decimal(cents).scaleb(-2)
+
+@lru_cache(maxsize=8)
+def _quarterly_due_dates(tax_year: int) -> tuple:
+    """Estimated payment due dates for a tax year"""
+    return (
+        f'{tax_year + 1}-01-15',  # Q4 previous year
+        f'{tax_year + 1}-04-15',  # Q1
+        f'{tax_year + 1}-06-15',  # Q2
+        f'{tax_year + 1}-09-15'   # Q3
+    )
+
+def _cached_calculator(calculators: Dict[str, Any], factory: StateCalculatorFactory,
+                       state: str):
+    """State calculator from calculators, created by factory on first use"""
+    calculator = calculators.get(state)
+    if calculator is None:
+        calculator = calculators[state] = factory.get_calculator(state)
+    return calculator
+
+# Full state names by abbreviation, for result metadata
+_STATE_NAMES: Dict[str, str] = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+    'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+    'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+    'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+    'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+    'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+    'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+    'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
+}
+
+class StateTaxResult(TypedDict, total=False):
+    """
+    calculate_state_tax result: the state calculator's own fields plus this
+    metadata. A plain dict at runtime, so existing consumers are unaffected
+    """
+    state: str
+    state_name: str
+    residency_status: str
+    tax_year: int
+    has_income_tax: bool
+    state_tax_liability: Decimal
+
 class StateTaxCalculator:
     """
     Main state tax calculator interface
@@ -73,19 +151,27 @@ class StateTaxCalculator:
     - State-specific forms and calculations
     """
     
+    __slots__ = (
+        'tax_year', 'calculator_factory', 'form_manager', 'residency_validator',
+        'multistate_validator', '_calculators', '_validator_cache'
+    )
+    
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
         self.calculator_factory = StateCalculatorFactory(tax_year)
         self.form_manager = StateFormManager(tax_year)
         self.residency_validator = ResidencyValidator()
         self.multistate_validator = MultiStateValidator()
+        # Per-state calculators, built by the factory on first use
+        self._calculators: Dict[str, Any] = {}
+        self._validator_cache: Dict[Tuple[str, int], StateFormValidator] = {}
     
     def calculate_state_tax(
         self, 
         taxpayer_data: dict, 
         state: str, 
         residency_status: str = 'resident'
-    ) -> dict:
+    ) -> StateTaxResult:
         """
         Calculate state income tax for a single state
         
@@ -97,30 +183,32 @@ class StateTaxCalculator:
         Returns:
             dict: State tax calculation results
         """
+        # Normalized once; the helpers below expect upper-case codes
+        state = state.upper()
         if not self._validate_state_code(state):
             raise ValueError(f"Invalid state code: {state}")
         
         # Get state-specific calculator
-        calculator = self.calculator_factory.get_calculator(state)
+        calculator = self._get_calculator(state)
         
         # Calculate state tax
-        result = calculator.calculate(taxpayer_data, residency_status)
+        result: StateTaxResult = calculator.calculate(taxpayer_data, residency_status)
         
-        # Add state-specific metadata
-        result.update({
-            'state': state,
-            'state_name': self._get_state_name(state),
-            'residency_status': residency_status,
-            'tax_year': self.tax_year,
-            'has_income_tax': state not in NO_INCOME_TAX_STATES
-        })
+        # Add state-specific metadata, set directly rather than through a
+        # temporary dict and update()
+        result['state'] = state
+        result['state_name'] = self._get_state_name(state)
+        result['residency_status'] = residency_status
+        result['tax_year'] = self.tax_year
+        result['has_income_tax'] = state not in _NO_INCOME_TAX_STATES
         
         return result
     
     def calculate_multistate_tax(
         self, 
         taxpayer_data: dict, 
-        state_scenarios: List[dict]
+        state_scenarios: List[dict],
+        max_workers: Optional[int] = None
     ) -> dict:
         """
         Calculate taxes for multiple states
@@ -132,36 +220,42 @@ class StateTaxCalculator:
                     {'state': 'CA', 'residency': 'resident', 'income': {...}},
                     {'state': 'NY', 'residency': 'nonresident', 'income': {...}}
                 ]
+            max_workers: If set, calculate the states concurrently on a
+                thread pool of up to this many workers
                 
         Returns:
             dict: Multi-state tax results with optimization
         """
-        results = {}
-        total_state_tax = Decimal('0')
+        # Normalized once up front so the results keys and the reciprocity
+        # lookups below see the same upper-case codes as calculate_state_tax
+        states = [scenario['state'].upper() for scenario in state_scenarios]
+        incomes = [scenario.get('income', taxpayer_data) for scenario in state_scenarios]
+        residencies = [scenario.get('residency', 'resident') for scenario in state_scenarios]
         
-        for scenario in state_scenarios:
-            state = scenario['state']
-            residency = scenario.get('residency', 'resident')
-            state_income = scenario.get('income', taxpayer_data)
-            
-            # Calculate for this state
-            state_result = self.calculate_state_tax(
-                state_income, 
-                state, 
-                residency
-            )
-            
-            results[state] = state_result
-            total_state_tax += state_result.get('state_tax_liability', 0)
+        # Each state is independent until reciprocity is applied below;
+        # map() keeps the results in scenario order either way
+        if max_workers and len(states) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(states))) as executor:
+                state_results = list(executor.map(
+                    self.calculate_state_tax, incomes, states, residencies
+                ))
+        else:
+            state_results = list(map(self.calculate_state_tax, incomes, states, residencies))
+        
+        results = dict(zip(states, state_results))
         
-        # Handle reciprocity agreements and credits
-        optimized_results = self._optimize_multistate_tax(results, taxpayer_data)
+        # Handle reciprocity agreements and credits, in place
+        self._optimize_multistate_tax(results, taxpayer_data)
+        
+        # The total comes from the summary, so both reflect the optimized
+        # per-state results
+        summary = self._generate_multistate_summary(results)
         
         return {
-            'individual_states': optimized_results,
-            'total_state_tax': total_state_tax,
+            'individual_states': results,
+            'total_state_tax': summary['total_state_tax'],
             'optimization_applied': True,
-            'summary': self._generate_multistate_summary(optimized_results)
+            'summary': summary
         }
     
     def estimate_quarterly_payments(
@@ -170,20 +264,20 @@ class StateTaxCalculator:
         state: str
     ) -> dict:
         """Estimate quarterly state tax payments"""
+        state = state.upper()
         annual_result = self.calculate_state_tax(taxpayer_data, state)
+        annual_tax = annual_result.get('state_tax_liability', 0)
         
-        quarterly_amount = annual_result.get('state_tax_liability', 0) / 4
+        # A quarter of the annual tax, rounded half up to the cent
+        quarterly_amount = (_from_cents(_to_cents(annual_tax)) / 4).quantize(
+            _CENT, rounding=ROUND_HALF_UP
+        )
         
         return {
             'state': state,
-            'annual_tax': annual_result.get('state_tax_liability', 0),
+            'annual_tax': annual_tax,
             'quarterly_payment': quarterly_amount,
-            'due_dates': [
-                f'{self.tax_year + 1}-01-15',  # Q4 previous year
-                f'{self.tax_year + 1}-04-15',  # Q1
-                f'{self.tax_year + 1}-06-15',  # Q2  
-                f'{self.tax_year + 1}-09-15'   # Q3
-            ]
+            'due_dates': list(_quarterly_due_dates(self.tax_year))
         }
     
     def get_state_forms_required(
@@ -193,7 +287,8 @@ class StateTaxCalculator:
         residency_status: str = 'resident'
     ) -> List[str]:
         """Get list of required state forms"""
-        calculator = self.calculator_factory.get_calculator(state)
+        state = state.upper()
+        calculator = self._get_calculator(state)
         return calculator.get_required_forms(taxpayer_data, residency_status)
     
     def validate_state_return(
@@ -202,56 +297,54 @@ class StateTaxCalculator:
         state: str
     ) -> dict:
         """Validate state tax return data"""
-        validator = StateFormValidator(state, self.tax_year)
+        state = state.upper()
+        key = (state, self.tax_year)
+        validator = self._validator_cache.get(key)
+        if validator is None:
+            validator = self._validator_cache[key] = StateFormValidator(state, self.tax_year)
         return validator.validate(taxpayer_data)
     
+    def _get_calculator(self, state: str):
+        """State calculator from the factory, created once per state"""
+        return _cached_calculator(self._calculators, self.calculator_factory, state)
+    
     def _validate_state_code(self, state: str) -> bool:
-        """Validate state code"""
-        return state.upper() in STATE_ABBREVIATIONS
+        """Validate an upper-case state code"""
+        return state in _STATE_CODES
     
     def _get_state_name(self, state: str) -> str:
-        """Get full state name from abbreviation"""
-        state_names = {
-            'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-            'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-            'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-            'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-            'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-            'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-            'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-            'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-            'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-            'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-            'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-            'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-            'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
-        }
-        return state_names.get(state.upper(), state)
+        """Get full state name from an upper-case abbreviation"""
+        return _STATE_NAMES.get(state, state)
     
     def _optimize_multistate_tax(
         self, 
         state_results: dict, 
         taxpayer_data: dict
     ) -> dict:
-        """Apply multistate tax optimizations"""
+        """
+        Apply multistate tax optimizations
+        
+        Updates state_results in place and returns it
+        """
         # Handle reciprocity agreements
         # Apply credits for taxes paid to other states
         # Optimize allocation and apportionment
         
-        optimized = state_results.copy()
-        
-        # Apply reciprocity agreements
+        # Apply reciprocity agreements, walking only each state's own
+        # agreements rather than every pair of states on the return. Every
+        # agreement sees the unoptimized results, so updates are applied
+        # after the walk; most returns have none
+        updates = []
         for state1, result1 in state_results.items():
-            for state2, result2 in state_results.items():
-                if state1 != state2:
-                    reciprocity = RECIPROCITY_AGREEMENTS.get(state1, {}).get(state2)
-                    if reciprocity:
-                        # Apply reciprocity benefits
-                        optimized[state1] = self._apply_reciprocity(
-                            result1, result2, reciprocity
-                        )
+            for state2, reciprocity in RECIPROCITY_AGREEMENTS.get(state1, _NO_AGREEMENTS).items():
+                if state2 != state1 and state2 in state_results and reciprocity:
+                    # Apply reciprocity benefits
+                    updates.append((state1, self._apply_reciprocity(
+                        result1, state_results[state2], reciprocity
+                    )))
         
-        return optimized
+        state_results.update(updates)
+        return state_results
     
     def _apply_reciprocity(self, state1_result: dict, state2_result: dict, reciprocity: dict) -> dict:
         """Apply reciprocity agreement benefits"""
@@ -260,57 +353,75 @@ class StateTaxCalculator:
     
     def _generate_multistate_summary(self, state_results: dict) -> dict:
         """Generate summary of multistate tax situation"""
-        total_tax = sum(
-            result.get('state_tax_liability', 0) 
-            for result in state_results.values()
-        )
+        # Total, taxed states and the highest-tax state in a single pass, with
+        # each liability converted to cents once
+        total_cents = 0
+        states_with_tax = []
+        highest_tax_state = None
+        highest_cents = 0
         
-        states_with_tax = [
-            state for state, result in state_results.items()
-            if result.get('state_tax_liability', 0) > 0
-        ]
+        for state, result in state_results.items():
+            cents = _to_cents(result.get('state_tax_liability', 0))
+            total_cents += cents
+            if cents > 0:
+                states_with_tax.append(state)
+            # Strictly greater, so ties go to the first state, as max() did
+            if highest_tax_state is None or cents > highest_cents:
+                highest_tax_state = state
+                highest_cents = cents
         
         return {
-            'total_state_tax': total_tax,
+            'total_state_tax': _from_cents(total_cents),
             'states_with_tax_due': states_with_tax,
             'number_of_states': len(state_results),
-            'highest_tax_state': max(
-                state_results.items(), 
-                key=lambda x: x[1].get('state_tax_liability', 0)
-            )[0] if state_results else None
+            'highest_tax_state': highest_tax_state
         }
 
 class StateFormGenerator:
     """Generate state-specific tax forms"""
     
+    __slots__ = ('tax_year', 'form_manager', '_factory', '_calculators')
+    
     def __init__(self, tax_year: int = 2024):
         self.tax_year = tax_year
         self.form_manager = StateFormManager(tax_year)
+        self._factory = StateCalculatorFactory(tax_year)
+        self._calculators: Dict[str, Any] = {}
     
     def generate_state_forms(
         self, 
         taxpayer_data: dict, 
         state: str,
-        output_dir: str = None
+        output_dir: str = None,
+        max_workers: Optional[int] = None
     ) -> List[str]:
-        """Generate all required state forms"""
-        calculator = StateCalculatorFactory(self.tax_year).get_calculator(state)
-        required_forms = calculator.get_required_forms(taxpayer_data)
+        """
+        Generate all required state forms
         
-        generated_files = []
+        With max_workers set, the PDFs are rendered concurrently on a thread
+        pool of up to that many workers; paths are returned in form order
+        either way
+        """
+        state = state.upper()
+        calculator = _cached_calculator(self._calculators, self._factory, state)
+        required_forms = list(calculator.get_required_forms(taxpayer_data))
         
-        for form_name in required_forms:
+        def generate(form_name: str) -> str:
             form_data = calculator.populate_form_data(taxpayer_data, form_name)
-            output_path = self.form_manager.generate_pdf(
+            return self.form_manager.generate_pdf(
                 state, form_name, form_data, output_dir
             )
-            generated_files.append(output_path)
         
-        return generated_files
+        if max_workers and len(required_forms) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(required_forms))) as executor:
+                return list(executor.map(generate, required_forms))
+        
+        return [generate(form_name) for form_name in required_forms]
 
 # Export main interfaces
 __all__ = [
     'StateTaxCalculator',
+    'StateTaxResult',
     'StateFormGenerator',
     'StateCalculatorFactory',
     'CaliforniaCalculator',
@@ -343,12 +454,20 @@ __all__ = [
     'format_state_currency'
 ]
 
-# Default calculator instance for easy access
-default_state_calculator = StateTaxCalculator()
+@lru_cache(maxsize=1)
+def _default_calculator() -> StateTaxCalculator:
+    """Default calculator for the convenience functions, created on first use"""
+    return StateTaxCalculator()
+
+def __getattr__(name: str) -> Any:
+    """Create the default calculator when default_state_calculator is first read"""
+    if name == 'default_state_calculator':
+        return _default_calculator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def calculate_state_tax(taxpayer_data: dict, state: str, residency_status: str = 'resident') -> dict:
     """Convenience function to calculate state tax using default calculator"""
-    return default_state_calculator.calculate_state_tax(taxpayer_data, state, residency_status)
+    return _default_calculator().calculate_state_tax(taxpayer_data, state, residency_status)
 
 def get_no_tax_states() -> List[str]:
     """Get list of states with no income tax"""
@@ -356,4 +475,4 @@ def get_no_tax_states() -> List[str]:
 
 def check_reciprocity(state1: str, state2: str) -> Optional[dict]:
     """Check if two states have reciprocity agreements"""
-    return RECIPROCITY_AGREEMENTS.get(state1, {}).get(state2)
+    return _RECIPROCITY_PAIRS.get((state1, state2))